@@ -0,0 +1,42 @@
+import os
+import threading
+from typing import Callable
+
+# Precompilación de los núcleos Numba
+# Los núcleos usan cache=True: la primera llamada de cada firma compila (segundos) y las
+# siguientes sesiones solo cargan el código desde disco. Cada módulo registra aquí una función
+# que llama a sus núcleos sobre entradas mínimas con los layouts reales; calentar() las ejecuta.
+# Es opcional: con BIOIMAGELAB_WARMUP=1 los módulos se precompilan al importarse (salvo los
+# registrados con al_importar=False, p. ej. plots, que mantiene su import liviano).
+
+_pendientes: list[Callable[[], None]] = []
+_lock = threading.Lock()
+
+def activo() -> bool:
+    """
+        True si BIOIMAGELAB_WARMUP=1 pide precompilar al importar (por defecto no).
+    """
+    return os.environ.get("BIOIMAGELAB_WARMUP", "0") == "1"
+
+def registrar(funcion: Callable[[], None], al_importar: bool = True) -> None:
+    """
+        Registra funcion, que precompila los núcleos de un módulo. Si la precompilación al
+        importar está activa (y al_importar lo permite) se ejecuta en el acto; si no, queda
+        pendiente hasta calentar().
+    """
+    if al_importar and activo():
+        funcion()
+        return
+    with _lock:
+        _pendientes.append(funcion)
+
+def calentar() -> None:
+    """
+        Ejecuta las precompilaciones pendientes de los módulos ya importados, por ejemplo al
+        arrancar un servidor o antes de medir tiempos.
+    """
+    with _lock:
+        funciones = list(_pendientes)
+        _pendientes.clear()
+    for funcion in funciones:
+        funcion()
@@ -1,4 +1,302 @@
-def plot_bioImagen_jn(self, canal: int = 0, z_stack: int = 0, timelapse: int = 0, fluoroforo: str = None):
+import numpy as np
+from collections import OrderedDict
+from .._warmup import registrar as registrar_warmup
+
+# matplotlib se importa de forma diferida en _lazy_mpl() (~300 ms de arranque que
+# no pagan quienes nunca grafican).
+plt = None
+ScalarMappable = None
+Normalize = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # Numba es opcional: sin él se usa NumPy
+    njit = None
+
+# --- MAPA DE COLORES PARA FLUORÓFOROS (RETRO) ---
+mapa_fluoroforos = {
+    'gfp': 'Greens', 'fitc': 'Greens', 'mng': 'Greens',
+    'rfp': 'Reds', 'mcherry': 'Reds', 'dsred': 'Reds',
+    'yfp': 'YlOrBr',  # Amarillo brillante
+    'dapi': 'Blues', 'cerulean_venus': 'GnBu',
+    'cy5': 'Purples'
+}
+
+# Colormaps obtenidos una sola vez (en _lazy_mpl), evitando buscarlos en el registro de
+# matplotlib en cada llamada. Nunca se mutan, por lo que no se copian.
+_FLUOR_CMAPS = {}
+_DEFAULT_CMAP = None  # magma, por defecto para modo Profesional
+_BIN_CMAP = None      # gray_r, binarias en modo Profesional
+# Versiones invertidas (_r): la inversión del modo retro se hace en la LUT, no sobre los pixeles.
+_FLUOR_CMAPS_R = {}
+# LUTs RGBA (256, 4) uint8 de los colormaps, indexadas por nombre
+_LUTS = {}
+
+
+def _lazy_mpl():
+    """
+        Importa matplotlib en el primer uso y precalcula los colormaps y LUTs de los fluoróforos.
+    """
+    global plt, ScalarMappable, Normalize, _DEFAULT_CMAP, _BIN_CMAP
+    if plt is not None:
+        return
+    import matplotlib.pyplot as _plt
+    from matplotlib.cm import ScalarMappable as _ScalarMappable
+    from matplotlib.colors import Normalize as _Normalize
+
+    _FLUOR_CMAPS.update({nombre: _plt.colormaps[cmap] for nombre, cmap in mapa_fluoroforos.items()})
+    _FLUOR_CMAPS_R.update({nombre: cmap.reversed() for nombre, cmap in _FLUOR_CMAPS.items()})
+    _DEFAULT_CMAP = _plt.colormaps['magma']
+    _BIN_CMAP = _plt.colormaps['gray_r']
+    _LUTS.update({
+        cmap.name: cmap(np.linspace(0.0, 1.0, 256), bytes=True)
+        for cmap in (*_FLUOR_CMAPS.values(), *_FLUOR_CMAPS_R.values(), _DEFAULT_CMAP, _BIN_CMAP)
+    })
+    ScalarMappable, Normalize = _ScalarMappable, _Normalize
+    plt = _plt
+
+# --- CONSTANTES DE ESTILO ---
+_ACCENT_RETRO, _ACCENT_PRO = '#33FF33', 'white'
+_FACE_RETRO, _FACE_PRO = 'black', '#0a0a0a'
+_FONT_RETRO, _FONT_PRO = 'monospace', 'sans-serif'
+
+_STYLE_APPLIED = False
+
+
+def _ensure_style():
+    """
+        Aplica el estilo 'dark_background' una única vez: plt.style.use reescribe
+        los rcParams globales, por lo que no debe ejecutarse en cada llamada.
+    """
+    global _STYLE_APPLIED
+    if not _STYLE_APPLIED:
+        plt.style.use('dark_background')
+        _STYLE_APPLIED = True
+
+def _apply_retro_style(ax, accent: str):
+    """
+        Estilo retro de un eje (grilla, bordes y ticks en color de acento).
+        Solo se aplica al crear los ejes: la figura persistente los conserva entre dibujos.
+    """
+    ax.grid(color=accent, linestyle=':', alpha=0.3)
+    for spine in ax.spines.values():
+        spine.set_color(accent)
+        spine.set_linewidth(1.5)
+    ax.tick_params(colors=accent, labelsize=8)
+
+# Máximo de cortes decimados guardados en self._display_cache
+_MAX_DISPLAY_CACHE = 64
+# Máximo de binarias coloreadas guardadas en self._bin_rgba (LRU, ~2 MB por corte decimado)
+_MAX_BIN_RGBA = 32
+# Máximo de planos leídos desde disco guardados en self._planos_cache (LRU)
+_MAX_PLANOS_CACHE = 8
+
+
+# Cachés de visualización guardadas sobre la instancia por plot_bioImagen_jn
+_CACHES_PLOT = ('_display_cache', '_rgba_cache', '_bin_rgba', '_stack_rgba', '_planos_cache')
+
+
+def _firma_datos(self) -> tuple:
+    """
+        Identidad de los datos que alimentan las cachés: self.img, la lista img_binaria, cada
+        máscara por canal y version_binaria (las máscaras se reescriben en el mismo buffer al
+        rebinarizar). Reemplazar o reescribir cualquiera de ellos cambia la firma.
+    """
+    binarias = getattr(self, 'img_binaria', None)
+    return (id(self.img), id(binarias), tuple(id(b) for b in binarias) if binarias is not None else (),
+            getattr(self, 'version_binaria', 0))
+
+
+def invalidar_caches_plot(self):
+    """
+        Descarta todas las cachés de visualización de la instancia. La llama plot_bioImagen_jn
+        al detectar que self.img o img_binaria fueron reemplazados.
+    """
+    for nombre in _CACHES_PLOT:
+        setattr(self, nombre, None)
+
+
+def _leer_plano(self, t: int, z: int, canal: int) -> np.ndarray:
+    """
+        Extrae el plano YX (t, z, canal) de self.img.
+        Si self.img es un array fuera de memoria (zarr.Array, h5py.Dataset, dask, ...) solo se
+        leen los chunks que cubren ese plano, por lo que conviene que el almacenamiento esté
+        troceado como (1, 1, 1, Y, X) o (1, 1, 1, chunkY, chunkX). Los planos decodificados se
+        guardan en una caché LRU para que redibujar el mismo corte no vuelva a leer el disco.
+
+        Complejidad:
+            O(1) para np.ndarray (vista), O(Y*X) por lectura en arrays fuera de memoria
+    """
+    if isinstance(self.img, np.ndarray):
+        return self.img[t, z, canal]
+
+    if getattr(self, '_planos_cache', None) is None:
+        self._planos_cache = OrderedDict()
+    cache = self._planos_cache
+    clave = (t, z, canal)
+    if clave in cache:
+        cache.move_to_end(clave)
+        return cache[clave]
+
+    plano = np.asarray(self.img[t, z, canal, :, :])
+    cache[clave] = plano
+    if len(cache) > _MAX_PLANOS_CACHE:
+        cache.popitem(last=False)
+    return plano
+
+
+# Los núcleos de esta sección no usan fastmath: son limitados por memoria (no gana nada) y
+# con él LLVM asume que no hay NaN, que sí aparecen en cortes flotantes (p. ej. RollingBall)
+if njit is not None:
+    @njit(cache=True)
+    def _minmax(a):
+        """
+            Mínimo y máximo de un corte 2D en una sola pasada sobre la memoria, ignorando NaN
+            (un corte todo NaN retorna NaN, NaN).
+        """
+        mn = a[0, 0]
+        mx = mn
+        vacio = True
+        for i in range(a.shape[0]):
+            for j in range(a.shape[1]):
+                v = a[i, j]
+                if v != v:
+                    continue
+                if vacio:
+                    mn = v
+                    mx = v
+                    vacio = False
+                else:
+                    mn = min(mn, v)
+                    mx = max(mx, v)
+        return mn, mx
+else:
+    def _minmax(a):
+        if a.dtype.kind == 'f':
+            return np.nanmin(a), np.nanmax(a)
+        return a.min(), a.max()
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _cuantizar_nb(planos, vmins, escalas, out):
+        """
+            Normalización y cast a uint8 fusionados en una pasada. planos es (P, N).
+            Los NaN van al índice 0, como los valores por debajo de vmin.
+        """
+        for p in range(planos.shape[0]):
+            vmin = vmins[p]
+            escala = escalas[p]
+            for i in prange(planos.shape[1]):
+                q = (planos[p, i] - vmin) * escala
+                out[p, i] = 0 if not q >= 0 else (255 if q > 255 else np.uint8(q))
+
+    @njit(parallel=True, cache=True)
+    def _aplicar_lut_nb(indices, lut, out):
+        """
+            out[i] = lut[indices[i]] para índices uint8 aplanados y una LUT (256, 4).
+        """
+        for i in prange(indices.shape[0]):
+            for c in range(4):
+                out[i, c] = lut[indices[i], c]
+
+    def _precompilar():
+        # dtypes habituales de los cortes, contiguos y decimados con strides
+        for dtype in (np.uint16, np.float32):
+            corte = np.zeros((4, 4), dtype=dtype)
+            _minmax(corte)
+            _minmax(corte[::2, ::2])
+            _cuantizar_nb(corte.reshape(1, -1), np.zeros(1, dtype=np.float32),
+                          np.ones(1, dtype=np.float32), np.empty((1, 16), dtype=np.uint8))
+        _aplicar_lut_nb(np.zeros(16, dtype=np.uint8), np.zeros((256, 4), dtype=np.uint8),
+                        np.empty((16, 4), dtype=np.uint8))
+
+    # El import de plots se mantiene liviano: solo se precompila con calentar()
+    registrar_warmup(_precompilar, al_importar=False)
+
+
+def _cuantizar_u8(data: np.ndarray, vmin, vmax) -> np.ndarray:
+    """
+        Normaliza data entre vmin y vmax y la cuantiza a índices uint8 [0, 255] de una LUT,
+        con el mismo criterio que usa matplotlib (floor(x * 256) recortado a 255).
+        Para un corte 2D vmin y vmax son escalares; para un stack 3D (Z, Y, X) son arrays
+        de largo Z con los extremos de cada corte.
+
+        Complejidad:
+            O(N) con N la cantidad de pixeles
+    """
+    vmins = np.atleast_1d(np.asarray(vmin, dtype=np.float32))
+    vmaxs = np.atleast_1d(np.asarray(vmax, dtype=np.float32))
+    rango = np.where(vmaxs > vmins, vmaxs - vmins, np.float32(1.0))
+    escalas = np.float32(256.0) / rango
+
+    planos = np.ascontiguousarray(data).reshape(vmins.size, -1)
+    if njit is not None:
+        out = np.empty(planos.shape, dtype=np.uint8)
+        _cuantizar_nb(planos, vmins, escalas, out)
+    else:
+        q = (planos.astype(np.float32) - vmins[:, None]) * escalas[:, None]
+        np.clip(q, 0, 255, out=q)
+        out = np.nan_to_num(q, copy=False, nan=0.0).astype(np.uint8)
+    return out.reshape(data.shape)
+
+
+def _aplicar_lut(indices: np.ndarray, lut: np.ndarray) -> np.ndarray:
+    """
+        Convierte índices uint8 de cualquier forma en un buffer RGBA uint8 de forma (..., 4).
+
+        Complejidad:
+            O(N) con N la cantidad de pixeles
+    """
+    if njit is None:
+        return lut[indices]
+    out = np.empty(indices.shape + (4,), dtype=np.uint8)
+    _aplicar_lut_nb(np.ascontiguousarray(indices).reshape(-1), lut, out.reshape(-1, 4))
+    return out
+
+
+def _lut_u8(cmap) -> np.ndarray:
+    """
+        Tabla de consulta (LUT) de 256 colores RGBA uint8 con forma (256, 4) extraída del
+        colormap. Las de los fluoróforos se precalculan en _lazy_mpl; otras se cachean al primer uso.
+    """
+    if cmap.name not in _LUTS:
+        _LUTS[cmap.name] = cmap(np.linspace(0.0, 1.0, 256), bytes=True)
+    return _LUTS[cmap.name]
+
+
+def _to_rgba_u8(data: np.ndarray, cmap, vmin, vmax) -> np.ndarray:
+    """
+        Normaliza y aplica el colormap una sola vez, devolviendo un buffer RGBA uint8 (..., 4).
+        imshow dibuja estos buffers directamente, sin volver a normalizar ni mapear colores,
+        por lo que el costo del colormap pasa de cada dibujo a cada cambio de datos.
+
+        Complejidad:
+            O(Y*X)
+    """
+    return _aplicar_lut(_cuantizar_u8(data, vmin, vmax), _lut_u8(cmap))
+
+
+def _decimar(corte: np.ndarray, stride: int, pooling_max: bool = False) -> np.ndarray:
+    """
+        Reduce un corte 2D a resolución de pantalla tomando 1 de cada `stride` pixeles
+        (vista con strides, sin copia). Con pooling_max=True se toma el máximo de cada
+        bloque, preservando objetos finos de las imágenes binarias.
+
+        Complejidad:
+            O(1) sin pooling, O(Y*X) con pooling
+    """
+    if stride <= 1:
+        return corte
+    if not pooling_max:
+        return corte[::stride, ::stride]
+    Y, X = corte.shape
+    filas = np.maximum.reduceat(corte, np.arange(0, Y, stride), axis=0)
+    return np.maximum.reduceat(filas, np.arange(0, X, stride), axis=1)
+
+
+def plot_bioImagen_jn(self, canal: int = 0, z_stack: int = 0, timelapse: int = 0, fluoroforo: str = None,
+                      precache: bool = False):
         """
           Visualización avanzada de BioImágenes con estilos Retro (fluoróforos) o Profesional (Trans).
 
@@ -9,9 +307,13 @@ def plot_bioImagen_jn(self, canal: int = 0, z_stack: int = 0, timelapse: int = 0
               fluoroforo: Tipo de fluoróforo ('gfp', 'rfp', 'yfp', 'mcherry', 'dsred',
                         'cerulean_venus', 'cy5', 'dapi', 'fitc', 'mng').
                         Si es None, usa estilo Profesional (Trans).
+              precache: Si es True, calcula de una vez los buffers RGBA de todos los cortes Z
+                        del (timelapse, canal) y los reutiliza al navegar el z-stack.
+                        Cambia memoria (Z*Y*X*4 bytes) por un desplazamiento en tiempo constante.
 
           Retorna:
-              None si hay error
+              None. Los índices fuera de rango se informan y retornan None; los errores de
+              datos (forma, tipo) se propagan como ValueError/IndexError/AssertionError.
 
           Complejidad:
               O(1) - solo extrae y muestra slices específicos
@@ -20,127 +322,233 @@ def plot_bioImagen_jn(self, canal: int = 0, z_stack: int = 0, timelapse: int = 0
             print("Error: Primero debes cargar la imagen con leer_bioImagen()")
             return None
 
-        try:
-            T, Z, C, Y, X = self.forma
+        _lazy_mpl()
 
-            # Validación de índices
-            if canal >= C or canal < 0:
+        # Datos nuevos (otra imagen, otras máscaras): las cachés anteriores ya no corresponden
+        firma = _firma_datos(self)
+        if getattr(self, '_firma_plot', None) != firma:
+            invalidar_caches_plot(self)
+            self._firma_plot = firma
+
+        canales = self.canales
+        T, Z, C, Y, X = self.forma
+
+        # Validación de índices: una sola comprobación en el camino normal.
+        # (a | b | c) < 0 detecta cualquier índice negativo con una única comparación.
+        if (canal | timelapse | z_stack) < 0 or canal >= C or timelapse >= T or z_stack >= Z:
+            if not (0 <= canal < C):
                 print(f"Error: Canal {canal} no existe. Disponibles: 0-{C-1}")
-                print(f"Nombres de canales: {self.canales}")
-                return None
-            if timelapse >= T or z_stack >= Z:
-                print(f"Error: Índices fuera de rango. T max: {T-1}, Z max: {Z-1}")
-                return None
-
-            # Extraer corte de imagen original
-            corte_imagen = self.img[timelapse, z_stack, canal, :, :]
-
-            # --- MAPA DE COLORES PARA FLUORÓFOROS (RETRO) ---
-            mapa_fluoroforos = {
-                'gfp': 'Greens', 'fitc': 'Greens', 'mng': 'Greens',
-                'rfp': 'Reds', 'mcherry': 'Reds', 'dsred': 'Reds',
-                'yfp': 'YlOrBr',  # Amarillo brillante
-                'dapi': 'Blues', 'cerulean_venus': 'GnBu',
-                'cy5': 'Purples'
-            }
-
-            # Determinar estilo
-            es_retro = False
-            target_cmap = 'magma'  # Por defecto para modo Profesional
-
-            if fluoroforo and fluoroforo.lower() in mapa_fluoroforos:
-                target_cmap = mapa_fluoroforos[fluoroforo.lower()]
-                es_retro = True
-
-            # Verificar si hay imagen binarizada
-            tiene_binaria = (self.img_normalizada is not None and
-                            self.img_binaria is not None and
-                            canal < len(self.img_binaria) and
-                            self.img_binaria[canal] is not None)
-
-            # --- CONFIGURACIÓN DE ESTILO ---
-            accent_color = '#33FF33' if es_retro else 'white'
-            face_color = 'black' if es_retro else '#0a0a0a'
-            font_style = 'monospace' if es_retro else 'sans-serif'
-
-            # Crear figura con contexto de estilo
-            plt.style.use('dark_background')
-            num_plots = 2 if tiene_binaria else 1
-            fig, axes = plt.subplots(1, num_plots,
-                                    figsize=(15 if tiene_binaria else 8, 7),
-                                    facecolor=face_color)
-
-            # Convertir axes a lista si solo hay un plot
-            if not tiene_binaria:
-                axes = [axes]
-
-            # --- PLOT 1: IMAGEN ORIGINAL ---
-            if es_retro:
-                # Invertir la imagen: fondo oscuro → negro, señales altas → blancas
-                corte_invertido = corte_imagen.max() - corte_imagen
-                # Aplicar colormap del fluoróforo (ahora sobre imagen invertida)
-                cmap = plt.colormaps.get_cmap(target_cmap).copy()
-                im0 = axes[0].imshow(corte_invertido, cmap=cmap, interpolation='bilinear')
-                axes[0].set_facecolor('black')  # Fondo negro
+                print(f"Nombres de canales: {canales}")
             else:
-                im0 = axes[0].imshow(corte_imagen, cmap=target_cmap)
+                print(f"Error: Índices fuera de rango. T max: {T-1}, Z max: {Z-1}")
+            return None
 
-            if es_retro:
-                titulo_0 = f">> {fluoroforo.upper()}_SIGNAL"
-                axes[0].set_title(titulo_0, color=accent_color, fontsize=12,
-                                loc='left', pad=15, fontfamily='monospace')
-                axes[0].grid(color=accent_color, linestyle=':', alpha=0.3)
-                for spine in axes[0].spines.values():
-                    spine.set_color(accent_color)
-                    spine.set_linewidth(1.5)
-                axes[0].tick_params(colors=accent_color, labelsize=8)
-            else:
-                titulo_0 = f"Canal: {self.canales[canal]}"
-                axes[0].set_title(titulo_0, color=accent_color, fontsize=12, pad=15)
-                axes[0].axis('off')
-                plt.colorbar(im0, ax=axes[0], fraction=0.046, pad=0.04,
-                        label='Intensidad')
+        # Extraer corte de imagen original (plano YX contiguo para recorrerlo linealmente)
+        corte_imagen = _leer_plano(self, timelapse, z_stack, canal)
+        if not corte_imagen.flags.c_contiguous:
+            corte_imagen = np.ascontiguousarray(corte_imagen)
+
+        # Determinar estilo
+        clave_fluor = fluoroforo.lower() if fluoroforo else None
+        es_retro = clave_fluor in _FLUOR_CMAPS
+        cmap = _FLUOR_CMAPS.get(clave_fluor, _DEFAULT_CMAP)
+        cmap_r = _FLUOR_CMAPS_R.get(clave_fluor)
+
+        # Verificar si hay imagen binarizada
+        tiene_binaria = (self.img_normalizada is not None and
+                        self.img_binaria is not None and
+                        canal < len(self.img_binaria) and
+                        self.img_binaria[canal] is not None)
+
+        # --- CONFIGURACIÓN DE ESTILO ---
+        accent_color = _ACCENT_RETRO if es_retro else _ACCENT_PRO
+        face_color = _FACE_RETRO if es_retro else _FACE_PRO
+        font_style = _FONT_RETRO if es_retro else _FONT_PRO
 
-            # --- PLOT 2: IMAGEN BINARIA (si existe) ---
+        num_plots = 2 if tiene_binaria else 1
+        ancho_fig = 15 if tiene_binaria else 8
+
+        # --- FIGURA PERSISTENTE ---
+        # Si ya hay una figura abierta con la misma configuración, solo se actualizan
+        # los datos de los AxesImage en lugar de reconstruir figura, ejes y artistas.
+        estado = getattr(self, '_plot_state', None)
+        reutilizar = (estado is not None and
+                      estado['num_plots'] == num_plots and
+                      estado['es_retro'] == es_retro and
+                      estado['fluoroforo'] == clave_fluor and
+                      plt.fignum_exists(estado['fig'].number))
+        dpi = estado['fig'].dpi if reutilizar else plt.rcParams['figure.dpi']
+
+        # --- DECIMACIÓN A RESOLUCIÓN DE PANTALLA ---
+        # Se dibujan como máximo ~2 pixeles de datos por pixel de pantalla.
+        ancho_eje_px = ancho_fig / num_plots * dpi
+        target_px = int(ancho_eje_px * 2)
+        stride = max(1, max(Y, X) // target_px)
+        # Bilinear solo cuando hay que ampliar; con más datos que pixeles basta 'nearest'
+        interpolacion = 'nearest' if max(Y, X) >= ancho_eje_px else 'bilinear'
+        extent = (-0.5, X - 0.5, Y - 0.5, -0.5)  # Conserva las coordenadas originales
+
+        if getattr(self, '_display_cache', None) is None:
+            self._display_cache = {}
+        # tiene_binaria entra en la clave: un corte guardado sin máscara no sirve tras binarizar
+        clave_cache = (canal, z_stack, timelapse, stride, tiene_binaria)
+        if clave_cache not in self._display_cache:
+            if len(self._display_cache) >= _MAX_DISPLAY_CACHE:
+                self._display_cache.clear()
+            corte_bin = None
             if tiene_binaria:
+                # Máscara binaria como uint8 {0, 1}: si llega como bool se reinterpreta sin copia;
+                # si llega empaquetada (un bit por píxel sobre X) se desempaqueta solo este corte
                 corte_bin = self.img_binaria[canal][timelapse, z_stack, 0, :, :]
+                if hasattr(corte_bin, 'get'):
+                    # Máscara en GPU (cupy.ndarray): se transfiere solo el corte mostrado
+                    corte_bin = corte_bin.get()
+                if corte_bin.dtype == np.bool_:
+                    corte_bin = corte_bin.view(np.uint8)
+                elif corte_bin.dtype != np.uint8:
+                    raise TypeError(
+                        f"img_binaria[{canal}] debe ser uint8 (0/1) o bool, no {corte_bin.dtype}")
+                elif corte_bin.shape[-1] != X:
+                    corte_bin = np.unpackbits(corte_bin, axis=-1, count=X, bitorder='little')
+            self._display_cache[clave_cache] = (
+                _decimar(corte_imagen, stride),
+                _decimar(corte_bin, stride, pooling_max=True) if tiene_binaria else None
+            )
+        corte_imagen, corte_bin = self._display_cache[clave_cache]
 
-                if es_retro:
-                    # En modo retro: invertir binaria y aplicar color del fluoróforo
-                    # 0 → 255 (blanco→color), 255 → 0 (negro)
-                    corte_bin_invertido = 255 - corte_bin
-                    cmap_bin = plt.colormaps.get_cmap(target_cmap).copy()
-                    axes[1].imshow(corte_bin_invertido, cmap=cmap_bin, interpolation='nearest')
-                    axes[1].set_facecolor('black')  # Fondo negro
-                else:
-                    # En modo Trans: objetos blancos sobre fondo negro
-                    axes[1].imshow(corte_bin, cmap='gray_r')
-                    axes[1].set_facecolor('black')
-
-                if es_retro:
-                    axes[1].set_title(">> BINARY_DECODE", color=accent_color,
-                                    fontsize=12, loc='left', pad=15,
-                                    fontfamily='monospace')
-                    axes[1].grid(color=accent_color, linestyle=':', alpha=0.3)
-                    for spine in axes[1].spines.values():
-                        spine.set_color(accent_color)
-                        spine.set_linewidth(1.5)
-                    axes[1].tick_params(colors=accent_color, labelsize=8)
-                else:
-                    axes[1].set_title("Binaria", color=accent_color,
-                                    fontsize=12, pad=15)
-                    axes[1].axis('off')
+        # --- RGBA PRECALCULADO ---
+        # En modo retro se usa el colormap invertido (ver inversión más abajo).
+        cmap_img = cmap_r if es_retro else cmap
+        if getattr(self, '_rgba_cache', None) is None:
+            self._rgba_cache = {}
+        clave_rgba = clave_cache + (clave_fluor,)
+        if precache:
+            # Se guarda un único stack a la vez para acotar la memoria
+            clave_stack = (timelapse, canal, stride, clave_fluor)
+            stack_rgba = getattr(self, '_stack_rgba', None)
+            if stack_rgba is None or clave_stack not in stack_rgba:
+                stack = np.stack([_decimar(_leer_plano(self, timelapse, z, canal), stride)
+                                  for z in range(Z)])
+                vmins = stack.min(axis=(1, 2))
+                vmaxs = stack.max(axis=(1, 2))
+                self._stack_rgba = {
+                    clave_stack: (_to_rgba_u8(stack, cmap_img, vmins, vmaxs), vmins, vmaxs)
+                }
+            rgba_stack, vmins, vmaxs = self._stack_rgba[clave_stack]
+            rgba_imagen = rgba_stack[z_stack]
+            vmin, vmax = float(vmins[z_stack]), float(vmaxs[z_stack])
+        else:
+            if clave_rgba not in self._rgba_cache:
+                if len(self._rgba_cache) >= _MAX_DISPLAY_CACHE:
+                    self._rgba_cache.clear()
+                vmin, vmax = (float(v) for v in _minmax(corte_imagen))
+                self._rgba_cache[clave_rgba] = (
+                    _to_rgba_u8(corte_imagen, cmap_img, vmin, vmax), vmin, vmax
+                )
+            rgba_imagen, vmin, vmax = self._rgba_cache[clave_rgba]
 
-            # Título superior
-            suptitle_text = f"Z:{z_stack} | T:{timelapse} | BIO-IMAGING SYSTEM" if es_retro else f"Canal {canal} | Z-stack:{z_stack} | Tiempo:{timelapse}"
-            plt.suptitle(suptitle_text, color=accent_color, fontsize=10,
-                        alpha=0.7, y=0.98, fontfamily=font_style)
+        # --- BINARIA PRECOLOREADA ---
+        # Se colorea una sola vez por máscara: la clave incluye el buffer y su versión, de modo
+        # que rebinarizar con otro umbral vuelve a colorear.
+        rgba_bin = None
+        if tiene_binaria:
+            if getattr(self, '_bin_rgba', None) is None:
+                self._bin_rgba = OrderedDict()
+            clave_bin = (canal, timelapse, z_stack, stride, clave_fluor,
+                         id(self.img_binaria[canal]), getattr(self, 'version_binaria', 0))
+            if clave_bin in self._bin_rgba:
+                self._bin_rgba.move_to_end(clave_bin)
+            else:
+                # En modo retro: 0 → color del fluoróforo, 1 → negro (colormap invertido).
+                # En modo Trans: objetos blancos sobre fondo negro (gray_r).
+                self._bin_rgba[clave_bin] = _to_rgba_u8(corte_bin, cmap_r if es_retro else _BIN_CMAP, 0, 1)
+                if len(self._bin_rgba) > _MAX_BIN_RGBA:
+                    self._bin_rgba.popitem(last=False)
+            rgba_bin = self._bin_rgba[clave_bin]
 
-            plt.tight_layout()
-            plt.show()
+        titulo_0 = (f">> {fluoroforo.upper()}_SIGNAL" if es_retro
+                    else f"Canal: {canales[canal]}")
+        suptitle_text = f"Z:{z_stack} | T:{timelapse} | BIO-IMAGING SYSTEM" if es_retro else f"Canal {canal} | Z-stack:{z_stack} | Tiempo:{timelapse}"
+
+        if reutilizar:
+            estado['im0'].set_data(rgba_imagen)
+            estado['im0'].set_interpolation(interpolacion)
+            estado['im0'].set_extent(extent)
+            if estado['cbar'] is not None:
+                estado['escala'].set_clim(vmin, vmax)
+                estado['cbar'].update_normal(estado['escala'])
+            if tiene_binaria:
+                estado['im_bin'].set_data(rgba_bin)
+                estado['im_bin'].set_extent(extent)
+            estado['titulo_0'].set_text(titulo_0)
+            estado['suptitle'].set_text(suptitle_text)
+            estado['fig'].canvas.draw_idle()
+            return None
+
+        # Crear figura con contexto de estilo
+        _ensure_style()
+        # constrained_layout resuelve el layout al dibujar (sin tight_layout por llamada)
+        fig, axes = plt.subplots(1, num_plots,
+                                figsize=(ancho_fig, 7),
+                                facecolor=face_color,
+                                constrained_layout=True)
 
+        # Convertir axes a lista si solo hay un plot
+        if not tiene_binaria:
+            axes = [axes]
+
+        # --- PLOT 1: IMAGEN ORIGINAL ---
+        if es_retro:
+            # Invertir la imagen: fondo oscuro → negro, señales altas → blancas.
+            # Se usa el colormap invertido en vez de calcular max - imagen (sin copia extra).
+            im0 = axes[0].imshow(rgba_imagen, interpolation=interpolacion, extent=extent)
+            axes[0].set_facecolor('black')  # Fondo negro
+        else:
+            im0 = axes[0].imshow(rgba_imagen, interpolation=interpolacion, extent=extent)
+
+        # El AxesImage muestra RGBA, así que la barra de color usa su propio mappable
+        escala, cbar = None, None
+        if es_retro:
+            texto_titulo_0 = axes[0].set_title(titulo_0, color=accent_color, fontsize=12,
+                            loc='left', pad=15, fontfamily='monospace')
+            _apply_retro_style(axes[0], accent_color)
+        else:
+            texto_titulo_0 = axes[0].set_title(titulo_0, color=accent_color, fontsize=12, pad=15)
+            axes[0].axis('off')
+            escala = ScalarMappable(norm=Normalize(vmin=vmin, vmax=vmax), cmap=cmap)
+            cbar = fig.colorbar(escala, ax=axes[0], shrink=0.9, label='Intensidad')
+
+        # --- PLOT 2: IMAGEN BINARIA (si existe) ---
+        im_bin = None
+        if tiene_binaria:
+            im_bin = axes[1].imshow(rgba_bin, interpolation='nearest', extent=extent)
+            axes[1].set_facecolor('black')  # Fondo negro
+
+            if es_retro:
+                axes[1].set_title(">> BINARY_DECODE", color=accent_color,
+                                fontsize=12, loc='left', pad=15,
+                                fontfamily='monospace')
+                _apply_retro_style(axes[1], accent_color)
+            else:
+                axes[1].set_title("Binaria", color=accent_color,
+                                fontsize=12, pad=15)
+                axes[1].axis('off')
+
+        # Título superior
+        texto_suptitle = fig.suptitle(suptitle_text, color=accent_color, fontsize=10,
+                    alpha=0.7, y=0.98, fontfamily=font_style)
+
+        self._plot_state = {
+            'fig': fig, 'axes': axes, 'im0': im0, 'im_bin': im_bin,
+            'escala': escala, 'cbar': cbar,
+            'titulo_0': texto_titulo_0, 'suptitle': texto_suptitle,
+            'num_plots': num_plots, 'es_retro': es_retro, 'fluoroforo': clave_fluor
+        }
+
+        # Solo la visualización puede fallar por causas externas (backend, display)
+        try:
+            plt.show()
         except Exception as e:
             print(f"Error al graficar la imagen: {e}")
             import traceback
             traceback.print_exc()
-            return None
\ No newline at end of file
@@ -1,11 +1,20 @@
+import os
+import tempfile
+import weakref
 import numpy as np
 import cv2
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Union, List, Optional, Tuple
 from bioio import BioImage
 import bioio_bioformats
-import matplotlib.pyplot as plt
+from ..filtrador._pool import release
+
+try:
+    import bioio_tifffile
+except ImportError:  # Lector TIFF opcional, sin JVM
+    bioio_tifffile = None
 
 # Tipos inmutables para manejar archivos
 
@@ -19,6 +28,56 @@ class BioImagen:
 
 TipoOrigen = Union[ImagenEstandar, BioImagen]
 
+# Backends de lectura para bioimágenes y extensiones que el lector nativo (sin JVM) resuelve
+_BACKENDS = {"auto", "bioformats", "tifffile"}
+_FORMATOS_TIFF = {".tif", ".tiff"}
+
+# Conversión a gris de las imágenes estándar en color según su número de canales (BGR / BGRA)
+_A_GRIS = {3: cv2.COLOR_BGR2GRAY, 4: cv2.COLOR_BGRA2GRAY}
+
+# Tamaño de L3 asumido para dimensionar los tiles de iterar_tiles (se usa la mitad por tile)
+_L3_BYTES = 32 * 1024 * 1024
+
+def _tzcyx(buffer_ctzyx: np.ndarray) -> np.ndarray:
+    """
+    Vista [T, Z, C, Y, X] de un buffer almacenado canal-mayor (C, T, Z, Y, X), sin copiar.
+    """
+    return buffer_ctzyx.transpose(1, 2, 0, 3, 4)
+
+def _separar_bits(x: int) -> int:
+    """
+    Intercala ceros entre los 16 bits bajos de x (bit i pasa a la posición 2i).
+    """
+    x &= 0x0000FFFF
+    x = (x | (x << 8)) & 0x00FF00FF
+    x = (x | (x << 4)) & 0x0F0F0F0F
+    x = (x | (x << 2)) & 0x33333333
+    x = (x | (x << 1)) & 0x55555555
+    return x
+
+def _morton2(a: int, b: int) -> int:
+    """
+    Índice de Morton (orden Z) de (a, b): bits de a en las posiciones pares, de b en las impares.
+    """
+    return _separar_bits(a) | (_separar_bits(b) << 1)
+
+def _solo_lectura(corte: np.ndarray) -> np.ndarray:
+    """
+    Vista de solo lectura de un corte: no copia datos y no afecta al array base.
+    """
+    vista = corte.view()
+    vista.flags.writeable = False
+    return vista
+
+def _borrar_archivo(ruta: str):
+    """
+    Borra el archivo temporal de un buffer en disco, si todavía existe.
+    """
+    try:
+        os.remove(ruta)
+    except OSError:
+        pass
+
 class ControladorBioImagen:
     """
     Clase "Handler" para leer y preprocesar imágenes de microscopía en formato .png, .jpg, .tiff y formatos de bioimagen confocal como .ics/.ids.
@@ -32,67 +91,186 @@ class ControladorBioImagen:
       - El MultiArray es [T, Z, C, Y, X] donde T es el "timelapse", Z el "Z-stacking" (diferentes planos en el eje Z), C es el Canal de fluorescencia ("Azul", "Rojo", "Verde" y "Campo" que puede
       ser claro u oscuro), y los ejes de pixeles X e Y son las dimensiones de la imagen.
       - Una imagen bidimensional sería (1, 1, 1, Y, X), por ejemplo, de formatos .jpg y .png.
-      - Se usa .copy() en getters y el iterador dado que sino permitiria la sobreescritura en algo que deberia
-      ser solo lectura.
+      - Internamente los datos se almacenan canal-mayor (C, T, Z, Y, X) y self.img es una vista TZCYX
+      de ese buffer: la indexación [t, z, canal] no cambia, pero self.img[:, :, canal] es un único
+      bloque contiguo T*Z*Y*X que los filtros por canal recorren linealmente.
+      - Los getters y los iteradores devuelven vistas de solo lectura (writeable=False) en lugar de copias,
+      evitando un memcpy de Y*X por acceso sin permitir la sobreescritura de la imagen. Quien necesite
+      modificar el corte puede pedir copy=True.
+      - Con perezoso=True las bioimágenes no se leen al cargar: se conserva el arreglo dask de
+      bioio (self._dask, TZCYX) y cada canal se materializa recién al pedirlo (iteradores,
+      filtros), una sola vez; get_corte_original lee solo el plano pedido. self.img queda en
+      None y el pico de memoria pasa de todo el volumen a un canal.
     """
 
-    def __init__(self, ruta_imagen):
+    # Extensiones que se leen como bioimagen (constante de clase: no se rearma por archivo)
+    _FORMATOS_BIO = frozenset({".ids", ".ics", ".tiff", ".tif"})
+
+    def __init__(self, ruta_imagen, backend: str = "auto", en_disco: bool = False, perezoso: bool = False):
+        """
+        Argumentos:
+            ruta_imagen: Ruta del archivo
+            backend: Lector de bioimágenes: "bioformats" (JVM), "tifffile" (nativo, solo TIFF) o
+                "auto", que usa tifffile para .tif/.tiff si está instalado y bioformats en el resto
+            en_disco: Si True, las bioimágenes y img_procesada se respaldan en archivos temporales
+                mapeados en memoria (np.memmap): el sistema operativo pagina bajo demanda y el
+                working set de z-stacks grandes no tiene que caber en RAM
+            perezoso: Si True, las bioimágenes se leen bajo demanda por canal a través de dask
+        """
+        if backend not in _BACKENDS:
+            raise ValueError(f"backend '{backend}' no válido. Opciones: {sorted(_BACKENDS)}")
+        self.backend = backend
+        self.en_disco = en_disco
+        self.perezoso = perezoso
         self.ruta_imagen = Path(ruta_imagen)
         self.configuracion: TipoOrigen = self._clasificar_imagen(self.ruta_imagen)
 
         # Datos del MultiArray [T, Z, C, Y, X] pre-procesamiento
         self.img: Optional[np.ndarray] = None
+        # Arreglo dask [T, Z, C, Y, X] sin materializar (modo perezoso)
+        self._dask = None
         self.canales: List[str] = []
         self.forma: Tuple[int, ...] = ()
+        # dtype nativo de la imagen leída (uint8, uint16, float32...), sin reescalar
+        self.dtype: Optional[np.dtype] = None
+        # Forma (Y, X) esperada de cada corte, precalculada para los setters
+        self._forma_corte: Tuple[int, ...] = ()
+        # Totales precalculados para __len__, __eq__ y __hash__
+        self._len: int = 0
+        self._key: tuple = (self.ruta_imagen, self.forma)
+        # Caché por canal de copias contiguas (T, Z, Y, X), construidas bajo demanda
+        self._img_by_channel: List[Optional[np.ndarray]] = []
 
         # Versión del MultiArray post-procesamiento
         self.img_procesada: Optional[np.ndarray] = None
+        # Mapa (T, Z, C) de cortes ya escritos en img_procesada (reservada sin inicializar)
+        self._cortes_escritos: Optional[np.ndarray] = None
 
     def __bool__(self) -> bool:
         # Metodo para indicar si o no está cargada la imagen.
-        return self.img is not None
+        return self.img is not None or self._dask is not None
 
     def _clasificar_imagen(self, ruta: Path) -> TipoOrigen:
         """
         Determina el tipo de origen basado en la extensión (Fábrica).
         """
-        formatos_bio = {".ids", ".ics", ".tiff", ".tif"}
-        if ruta.suffix.lower() in formatos_bio:
-            return BioImagen(ruta)
-        return ImagenEstandar(ruta)
+        return BioImagen(ruta) if ruta.suffix.lower() in self._FORMATOS_BIO else ImagenEstandar(ruta)
+
+    def _lector_bio(self, ruta: Path):
+        """
+        Elige el Reader de bioio según el backend. El lector tifffile evita el arranque de la JVM
+        y las copias Java/Python de bioformats en los TIFF, el caso más frecuente.
+        """
+        es_tiff = ruta.suffix.lower() in _FORMATOS_TIFF
+        if self.backend == "tifffile":
+            if bioio_tifffile is None:
+                raise ImportError("El backend 'tifffile' requiere el paquete bioio-tifffile")
+            if not es_tiff:
+                raise ValueError(f"El backend 'tifffile' no lee archivos {ruta.suffix}")
+            return bioio_tifffile.Reader
+        if self.backend == "auto" and es_tiff and bioio_tifffile is not None:
+            return bioio_tifffile.Reader
+        return bioio_bioformats.Reader
 
     def leer_bioImagen(self) -> Optional[np.ndarray]:
         """
         Selector de modos estricto para cargar y normalizar a 5D.
+        Retorna self.img (en modo perezoso, el arreglo dask sin materializar) o None si falla.
         """
         try:
+            self._dask = None
             match self.configuracion:
+                case BioImagen(ruta) if self.perezoso:
+                    # Solo el grafo: los planos se leen al materializar cada canal
+                    img = BioImage(ruta, reader=self._lector_bio(ruta))
+                    self.img = None
+                    self._dask = img.get_image_dask_data("TZCYX")
+                    self.canales = img.channel_names
+
                 case BioImagen(ruta):
-                    img = BioImage(ruta, reader=bioio_bioformats.Reader)
-                    self.img = img.get_image_data("TZCYX")
+                    img = BioImage(ruta, reader=self._lector_bio(ruta))
+                    # Lectura plano a plano en un buffer reservado una vez: evita materializar
+                    # el tensor completo del lado de Java y copiarlo de nuevo a NumPy
+                    dims = img.dims
+                    buffer = self._reservar((dims.C, dims.T, dims.Z, dims.Y, dims.X), img.dtype)
+                    for c in range(dims.C):
+                        for t in range(dims.T):
+                            for z in range(dims.Z):
+                                buffer[c, t, z] = img.get_image_data("YX", T=t, Z=z, C=c)
+                    self.img = _tzcyx(buffer)
                     self.canales = img.channel_names
 
                 case ImagenEstandar(ruta):
-                    img_raw = cv2.imread(str(ruta), cv2.IMREAD_GRAYSCALE)
+                    # Profundidad nativa: un PNG de 16 bits se conserva y uno de 8 bits no se
+                    # duplica en memoria; el normalizador elige la ruta según el dtype (tabla
+                    # para uint8/uint16, escalado directo para flotantes)
+                    img_raw = cv2.imread(str(ruta), cv2.IMREAD_UNCHANGED)
                     if img_raw is None:
                         raise FileNotFoundError(f"Archivo no encontrado: {ruta}")
+                    if img_raw.ndim == 3:
+                        img_raw = cv2.cvtColor(img_raw, _A_GRIS[img_raw.shape[2]])
 
-                    # Normalización a 16-bit y expansión a 5D: [T, Z, C, Y, X]
-                    img_raw = img_raw.astype(np.uint16) * 256
-                    self.img = img_raw[np.newaxis, np.newaxis, np.newaxis, :, :]
+                    # Expansión a 5D [T, Z, C, Y, X] como vista del plano leído, sin copiar
+                    self.img = np.ascontiguousarray(img_raw).reshape((1, 1, 1) + img_raw.shape)
                     self.canales = ["Gris"]
 
-            if self.img is not None:
-                self.forma = self.img.shape
-                # Inicializar img_procesada con la misma forma
-                self.img_procesada = np.zeros_like(self.img)
-            return self.img
+            if self:
+                if self.img is not None:
+                    # Ambas ramas entregan una vista TZCYX de un buffer CTZYX C-contiguo
+                    if not self.img.transpose(2, 0, 1, 3, 4).flags['C_CONTIGUOUS']:
+                        raise ValueError(
+                            "self.img debe ser una vista TZCYX de un buffer CTZYX C-contiguo "
+                            f"(canal-mayor); strides recibidos: {self.img.strides}")
+                datos = self.img if self.img is not None else self._dask
+                self.forma = tuple(datos.shape)
+                self.dtype = np.dtype(datos.dtype)
+                self._forma_corte = self.forma[3:]
+                self._len = self.forma[0] * self.forma[1]
+                self._key = (self.ruta_imagen, self.forma)
+                # Invalidar las vistas por canal de una lectura anterior
+                self._img_by_channel = [None] * self.forma[2]
+                # img_procesada se reserva recién en el primer set_corte_procesado
+                self.img_procesada = None
+                self._cortes_escritos = None
+            return self.img if self.img is not None else self._dask
 
         except Exception as e:
             print(f"Error al leer la imagen: {e}")
             return None
     
 
+    def _canal_view(self, c: int) -> np.ndarray:
+        """
+        Vista contigua de solo lectura (T, Z, Y, X) del canal c. Con el almacenamiento canal-mayor
+        es directamente self.img[:, :, c], sin copia. Si self.img fue reemplazado por un array
+        TZCYX real (donde el canal salta C planos entre cortes), se construye una copia contigua
+        una sola vez y se reutiliza.
+
+        Argumentos:
+            c: Índice del canal
+
+        Retorna:
+            Array 4D de solo lectura [T, Z, Y, X]
+
+        Complejidad:
+            O(1) (O(T*Z*Y*X) la primera vez si hay que copiar o leer el canal)
+        """
+        if self.img is None:
+            # Modo perezoso: el canal se lee del arreglo dask una sola vez
+            vista = self._img_by_channel[c]
+            if vista is None:
+                vista = _solo_lectura(np.ascontiguousarray(self._dask[:, :, c].compute()))
+                self._img_by_channel[c] = vista
+            return vista
+        canal = self.img[:, :, c]
+        if canal.flags['C_CONTIGUOUS']:
+            return _solo_lectura(canal)
+        vista = self._img_by_channel[c]
+        if vista is None:
+            vista = _solo_lectura(np.ascontiguousarray(canal))
+            self._img_by_channel[c] = vista
+        return vista
+
     def __iter__(self):
         """
         Iterador para poder buscar o iterar para todos los canales por tiempo y por z-stack, 
@@ -105,21 +283,24 @@ class ControladorBioImagen:
             O(T*Z*C) iteraciones
         """
 
-        if self.img is None:
+        if not self:
             return iter(())
-        T, Z, C, _, _ = self.forma
+        T, Z, C, Y, X = self.forma
+        # Un solo bucle plano por canal: índices (t, z) desde np.ndindex y cortes desde la
+        # vista (T*Z, Y, X) del canal contiguo
         for canal in range(C):
-            for t in range(T):
-                for z in range(Z):
-                    yield canal, t, z, self.img[t, z, canal].copy()
+            planos = self._canal_view(canal).reshape(-1, Y, X)
+            for (t, z), corte in zip(np.ndindex(T, Z), planos):
+                yield canal, t, z, corte
 
-    def iterar_cortes(self, canal: int = 0):
+    def iterar_cortes(self, canal: int = 0, copy: bool = False):
         """
         Iterador para poder buscar o iterar en un canal dado por tiempo y por z-stack, 
         obteniendo imágenes bidimensionales para su procesamiento.
 
         Argumentos:
             canal: Canal a iterar (default: 0)
+            copy: Si True, entrega copias modificables en lugar de vistas de solo lectura (default: False)
 
         Yields:
             Tupla (t, z, img_2d) donde img_2d es np.ndarray de forma (Y, X)
@@ -127,56 +308,266 @@ class ControladorBioImagen:
         Complejidad:
             O(T*Z) iteraciones
         """
-        if self.img is None:
+        if not self:
             raise ValueError("Imagen no cargada")
 
-        T, Z, C, _, _ = self.forma
+        T, Z, C, Y, X = self.forma
         
         if not (0 <= canal < C):
             raise IndexError(f"Canal {canal} fuera de rango. Canales disponibles: 0-{C-1}")
 
+        # Validación y búsquedas de atributos fuera del bucle: por corte solo queda un paso
+        # del bucle plano sobre la vista (T*Z, Y, X) del canal contiguo
+        planos = self._canal_view(canal).reshape(-1, Y, X)
+        if copy:
+            for (t, z), corte in zip(np.ndindex(T, Z), planos):
+                yield t, z, corte.copy()
+        else:
+            for (t, z), corte in zip(np.ndindex(T, Z), planos):
+                yield t, z, corte
+
+    def iterar_cortes_morton(self, canal: int = 0):
+        """
+        Iterador en orden de Morton (curva Z) sobre (t, z): los cortes consecutivos quedan cerca
+        en ambos ejes, de modo que operaciones que revisitan cortes vecinos (o lectores que cachean
+        planos decodificados) trabajan con O(sqrt(T*Z)) cortes activos en lugar de O(Z).
+
+        Argumentos:
+            canal: Canal a iterar (default: 0)
+
+        Yields:
+            Tupla (t, z, img_2d) donde img_2d es una vista de solo lectura (Y, X)
+
+        Complejidad:
+            O(T*Z log(T*Z)) por el ordenamiento, O(T*Z) iteraciones
+        """
+        if not self:
+            raise ValueError("Imagen no cargada")
+
+        T, Z, C, _, _ = self.forma
+
+        if not (0 <= canal < C):
+            raise IndexError(f"Canal {canal} fuera de rango. Canales disponibles: 0-{C-1}")
+
+        img_canal = self._canal_view(canal)
+        for t, z in sorted(np.ndindex(T, Z), key=lambda tz: _morton2(*tz)):
+            yield t, z, img_canal[t, z]
+
+    def iterar_cortes_batch(self, canal: int = 0, batch: Optional[int] = None):
+        """
+        Iterador por lotes: entrega bloques contiguos de B cortes (B, Y, X) de un canal, con los
+        ejes (T, Z) aplanados a N = T*Z en orden t-mayor (i = t*Z + z). Permite a las operaciones
+        posteriores trabajar sobre pilas completas en lugar de pagar el bucle de Python por corte.
+
+        Argumentos:
+            canal: Canal a iterar (default: 0)
+            batch: Cortes por bloque. Si None, se elige para que cada bloque ocupe ~1 MB (cabe en L2/L3)
+
+        Yields:
+            Tupla (i, bloque) donde i es el índice plano del primer corte (t, z = divmod(i, Z)) y
+            bloque es un np.ndarray de solo lectura de forma (B, Y, X); el último puede ser menor.
+
+        Complejidad:
+            O(T*Z / B) iteraciones (más la copia contigua del canal la primera vez)
+        """
+        if not self:
+            raise ValueError("Imagen no cargada")
+
+        T, Z, C, Y, X = self.forma
+
+        if not (0 <= canal < C):
+            raise IndexError(f"Canal {canal} fuera de rango. Canales disponibles: 0-{C-1}")
+
+        N = T * Z
+        if batch is None:
+            batch = max(1, (1 << 20) // (Y * X * self.dtype.itemsize))
+
+        # La copia contigua del canal se aplana a (N, Y, X) sin copiar; los bloques son vistas
+        pila = self._canal_view(canal).reshape(N, Y, X)
+        for i in range(0, N, batch):
+            yield i, pila[i:i + batch]
+
+    def iterar_tiles(self, canal: int = 0, tile_z: Optional[int] = None):
+        """
+        Iterador por tiles en Z: para cada t entrega bloques contiguos (tile_z, Y, X) del canal,
+        dimensionados para caber en media L3. Un filtro que recorre el tile con apply_stack
+        encuentra los cortes siguientes ya en caché en lugar de volver a la RAM por corte.
+
+        Argumentos:
+            canal: Canal a iterar (default: 0)
+            tile_z: Cortes Z por tile. Si None, el mayor con tile_z*Y*X*itemsize <= L3/2 (mínimo 1)
+
+        Yields:
+            Tupla (t, z_inicio, tile) con tile de solo lectura de forma (tile_z, Y, X); el último
+            tile de cada t puede ser menor.
+
+        Complejidad:
+            O(T * Z / tile_z) iteraciones (más la copia contigua del canal la primera vez)
+        """
+        if not self:
+            raise ValueError("Imagen no cargada")
+
+        T, Z, C, Y, X = self.forma
+
+        if not (0 <= canal < C):
+            raise IndexError(f"Canal {canal} fuera de rango. Canales disponibles: 0-{C-1}")
+
+        if tile_z is None:
+            tile_z = max(1, (_L3_BYTES // 2) // (Y * X * self.dtype.itemsize))
+
+        # Con el almacenamiento canal-mayor cada tile es un bloque contiguo del canal
+        pila = self._canal_view(canal)
         for t in range(T):
-            for z in range(Z):
-                yield t, z, self.img[t, z, canal].copy()
+            for z in range(0, Z, tile_z):
+                yield t, z, pila[t, z:z + tile_z]
 
     def set_corte_procesado(self,
                             canal: int = 0,
                             t: int = 0,
                             z: int = 0,
-                            img_2d: Optional[np.ndarray] = None):
+                            img_2d: Optional[np.ndarray] = None,
+                            liberar: bool = False):
         """
         Método setter para guardar una imagen 2D procesada en la estructura tensor 5D.
+        En la primera llamada reserva img_procesada con np.empty (sin escribir ceros); los cortes
+        que nunca se setean tienen contenido indefinido y get_corte_procesado los rechaza.
         
         Argumentos:
             canal: Índice del canal (default: 0)
             t: Índice del timelapse (default: 0)
             z: Índice del z-stack (default: 0)
             img_2d: Objeto np.ndarray a settear (si None, crea array de ceros)
+            liberar: Si True, img_2d se devuelve al pool de buffers de los filtros tras copiarlo
+                     (para resultados de un filtro llamado sin destino)
 
         Complejidad:
             O(1)
         """
-        if self.img_procesada is None:
-            raise ValueError("img_procesada no inicializada")
+        if not self:
+            raise ValueError("Imagen no cargada")
 
-        T, Z, C, Y, X = self.forma
+        T, Z, C, _, _ = self.forma
         
         if not (0 <= t < T and 0 <= z < Z and 0 <= canal < C):
             raise IndexError(f"Índices fuera de rango. T max: {T-1}, Z max: {Z-1}, C max: {C-1}")
 
         if img_2d is None:
-            img_2d = np.zeros((Y, X), dtype=self.img.dtype)
+            img_2d = np.zeros(self._forma_corte, dtype=self.dtype)
+        elif img_2d.shape != self._forma_corte:
+            # Una sola comparación de tuplas cubre dimensión y forma
+            raise ValueError(f"img_2d debe tener forma {self._forma_corte}, tiene {img_2d.shape}")
 
-        assert img_2d.ndim == 2, "img_2d debe ser 2D con forma (Y, X)"
-        assert img_2d.shape == (Y, X), f"img_2d debe tener forma ({Y}, {X}), tiene {img_2d.shape}"
-        
+        self._reservar_procesada()
+        self.set_corte_procesado_fast(canal, t, z, img_2d)
+        if liberar:
+            release(img_2d)
+
+    def set_corte_procesado_fast(self, canal: int, t: int, z: int, img_2d: np.ndarray):
+        """
+        Variante sin validaciones de set_corte_procesado para bucles por lotes: solo la asignación
+        indexada. Requiere img_procesada reservada (por ejemplo, tras un set_corte_procesado) e
+        índices y forma ya validados por el llamador.
+
+        Complejidad:
+            O(Y*X) de la copia del corte
+        """
         self.img_procesada[t, z, canal] = img_2d
+        self._cortes_escritos[t, z, canal] = True
     
+    def aplicar_filtro_canal(self, canal: int, filtro) -> np.ndarray:
+        """
+        Aplica un filtro a todos los cortes (t, z) de un canal en una sola llamada a
+        filtro.apply_stack, que escribe directamente en img_procesada[:, :, canal] (un bloque
+        contiguo con el almacenamiento canal-mayor), sin bucle de Python por corte aquí.
+
+        Argumentos:
+            canal: Índice del canal
+            filtro: Objeto con apply_stack(pila, out) (CajaBlur, Gaussiano, Bilateral)
+
+        Retorna:
+            Vista (T, Z, Y, X) del canal procesado
+
+        Complejidad:
+            O(T*Z*Y*X) en el filtro
+        """
+        if not self:
+            raise ValueError("Imagen no cargada")
+
+        T, Z, C, Y, X = self.forma
+
+        if not (0 <= canal < C):
+            raise IndexError(f"Canal {canal} fuera de rango. Canales disponibles: 0-{C-1}")
+
+        self._reservar_procesada()
+
+        resultado = filtro.apply_stack(self._canal_view(canal), out=self.img_procesada[:, :, canal])
+        self._cortes_escritos[:, :, canal] = True
+        return resultado
+
+    def aplicar_filtro_todos_canales(self, filtro, max_workers: Optional[int] = None) -> np.ndarray:
+        """
+        Aplica un filtro a todos los canales en paralelo, un canal por tarea de un pool de hilos.
+        Los canales son independientes y escriben en bloques disjuntos de img_procesada, y
+        OpenCV/NumPy liberan el GIL durante el filtrado.
+
+        Argumentos:
+            filtro: Objeto con apply_stack(pila, out) (CajaBlur, Gaussiano, Bilateral)
+            max_workers: Hilos del pool (default: min(C, núcleos disponibles))
+
+        Retorna:
+            img_procesada [T, Z, C, Y, X]
+
+        Complejidad:
+            O(T*Z*C*Y*X) repartido entre min(C, max_workers) hilos
+        """
+        if not self:
+            raise ValueError("Imagen no cargada")
+
+        C = self.forma[2]
+        self._reservar_procesada()
+        if max_workers is None:
+            max_workers = min(C, os.cpu_count() or 1)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            # list(...) propaga la primera excepción de cualquier canal
+            list(pool.map(lambda canal: self.aplicar_filtro_canal(canal, filtro), range(C)))
+        return self.img_procesada
+
+    def _reservar_procesada(self):
+        """
+        Reserva img_procesada (sin inicializar, mismo layout canal-mayor que self.img) y el mapa
+        de cortes escritos, si todavía no existen.
+        """
+        if self.img_procesada is None:
+            T, Z, C, Y, X = self.forma
+            self.img_procesada = _tzcyx(self._reservar((C, T, Z, Y, X), self.dtype))
+            self._cortes_escritos = np.zeros((T, Z, C), dtype=bool)
+
+    def _reservar(self, forma: Tuple[int, ...], dtype) -> np.ndarray:
+        """
+        Reserva un buffer sin inicializar: np.empty en RAM o, con en_disco, un np.memmap sobre
+        un archivo temporal. El archivo se borra apenas se mapea (en POSIX el mapeo sigue
+        válido y el espacio se libera con el último puntero al buffer), de modo que no quedan
+        archivos en el directorio temporal aunque el controlador no se use con with. Donde no
+        se puede borrar un archivo abierto (Windows) se borra al recolectarse el buffer.
+        """
+        if not self.en_disco:
+            return np.empty(forma, dtype=dtype)
+        fd, ruta = tempfile.mkstemp(prefix="bioImageLab_", suffix=".dat")
+        os.close(fd)
+        buffer = np.memmap(ruta, mode="w+", dtype=dtype, shape=forma)
+        try:
+            os.remove(ruta)
+        except OSError:
+            weakref.finalize(buffer, _borrar_archivo, ruta)
+        return buffer
+
     def _get_corte(self, 
                 img: np.ndarray, 
                 canal: int,
                 t: int,
-                z: int) -> np.ndarray:
+                z: int,
+                copy: bool = False) -> np.ndarray:
         """
         Función interna para realizar cortes en alguna estructura imagen 5D.
         
@@ -185,24 +576,27 @@ class ControladorBioImagen:
             canal: Índice del canal
             t: Índice del timelapse
             z: Índice del z-stack
+            copy: Si True, retorna una copia modificable en lugar de una vista de solo lectura
 
         Retorna:
             Array 2D [Y, X]
 
         Complejidad:
-            O(1) - solo indexación y copia
+            O(1) - solo indexación (O(Y*X) con copy=True)
         """
         T, Z, C, _, _ = img.shape
         
         if not (0 <= t < T and 0 <= z < Z and 0 <= canal < C):
             raise IndexError(f"Índices fuera de rango. T max: {T-1}, Z max: {Z-1}, C max: {C-1}")
         
-        return img[t, z, canal].copy()
+        corte = img[t, z, canal]
+        return corte.copy() if copy else _solo_lectura(corte)
 
     def get_corte_original(self,
                         canal: int = 0,
                         t: int = 0,
-                        z: int = 0) -> np.ndarray:
+                        z: int = 0,
+                        copy: bool = False) -> np.ndarray:
         """
         Método getter para obtener un corte de la estructura tensor 5D original.
         
@@ -210,6 +604,7 @@ class ControladorBioImagen:
             canal: Índice del canal (default: 0)
             t: Índice del timelapse (default: 0)
             z: Índice del z-stack (default: 0)
+            copy: Si True, retorna una copia modificable (default: False, vista de solo lectura)
 
         Retorna:
             Imagen 2D np.ndarray de forma (Y, X)
@@ -217,15 +612,27 @@ class ControladorBioImagen:
         Complejidad:
             O(1)
         """
-        if self.img is None:
+        if not self:
             raise ValueError("Imagen original no cargada")
 
-        return self._get_corte(self.img, canal, t, z)
+        if self.img is None:
+            # Modo perezoso: canal ya materializado o, si no, solo el plano pedido
+            T, Z, C, _, _ = self.forma
+            if not (0 <= t < T and 0 <= z < Z and 0 <= canal < C):
+                raise IndexError(f"Índices fuera de rango. T max: {T-1}, Z max: {Z-1}, C max: {C-1}")
+            vista = self._img_by_channel[canal]
+            if vista is not None:
+                return vista[t, z].copy() if copy else vista[t, z]
+            corte = np.asarray(self._dask[t, z, canal].compute())
+            return corte if copy else _solo_lectura(corte)
+
+        return self._get_corte(self.img, canal, t, z, copy)
 
     def get_corte_procesado(self,
                             canal: int = 0,
                             t: int = 0,
-                            z: int = 0) -> np.ndarray:
+                            z: int = 0,
+                            copy: bool = False) -> np.ndarray:
         """
         Método getter para obtener un corte de la estructura tensor 5D procesada.
         
@@ -233,6 +640,7 @@ class ControladorBioImagen:
             canal: Índice del canal (default: 0)
             t: Índice del timelapse (default: 0)
             z: Índice del z-stack (default: 0)
+            copy: Si True, retorna una copia modificable (default: False, vista de solo lectura)
 
         Retorna:
             Imagen 2D np.ndarray de forma (Y, X)
@@ -243,7 +651,10 @@ class ControladorBioImagen:
         if self.img_procesada is None:
             raise ValueError("No se ha hecho ninguna operación de procesamiento")
 
-        return self._get_corte(self.img_procesada, canal, t, z)
+        corte = self._get_corte(self.img_procesada, canal, t, z, copy)
+        if not self._cortes_escritos[t, z, canal]:
+            raise ValueError(f"El corte (canal={canal}, t={t}, z={z}) no fue procesado")
+        return corte
 
 
     def __eq__(self, other) -> bool:
@@ -253,13 +664,16 @@ class ControladorBioImagen:
             Complejida : O(1)
         """
 
-        if not isinstance(other, ControladorBioImagen):
-            return False
+        return isinstance(other, ControladorBioImagen) and self._key == other._key
 
-        return (
-            self.ruta_imagen == other.ruta_imagen and
-            self.forma == other.forma
-        )
+    def __hash__(self) -> int:
+        """
+            Hash consistente con __eq__ (ruta y forma). La forma se fija al leer la imagen:
+            conviene cargarla antes de usar el controlador como clave de un set o dict.
+            Retorna : Int
+            Complejida : O(1)
+        """
+        return hash(self._key)
 
 
     def __len__(self) -> int:
@@ -269,11 +683,7 @@ class ControladorBioImagen:
             Complejida : O(1)
         """
 
-        if self.img is None:
-            return 0
-        T, Z, *_ = self.forma
-
-        return T * Z
+        return self._len if self else 0
 
     # Metodos para I/O externo : Abrir imagenes, liberar memoria y cachear los bioformatos.
     def __enter__(self):
@@ -282,7 +692,10 @@ class ControladorBioImagen:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.img = None
+        self._dask = None
         self.img_procesada = None
+        self._cortes_escritos = None
+        self._img_by_channel = []
 
     def __repr__(self) -> str:
         """
@@ -290,7 +703,7 @@ class ControladorBioImagen:
             Retorna : String
             Complejidad : O(1)
         """
-        if self.img is None:
+        if not self:
             return f"<ControladorBioImagen ruta='{self.ruta_imagen}' (no cargada)>"
 
         T, Z, C, Y, X = self.forma
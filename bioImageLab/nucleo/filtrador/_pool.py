@@ -0,0 +1,44 @@
+import threading
+import numpy as np
+
+# Pool de buffers de salida para los filtros
+# Cada llamada a un filtro sin destino hace que OpenCV reserve un corte (Y, X) nuevo; a lo largo
+# de cientos de cortes eso fragmenta el heap. Los buffers devueltos con release se reciclan para
+# el siguiente corte de la misma forma y dtype.
+
+# Buffers libres conservados por (forma, dtype); los que exceden el tope se dejan al GC
+_MAX_POR_CLAVE = 8
+
+_libres: dict[tuple, list[np.ndarray]] = {}
+_lock = threading.Lock()
+
+def get_buffer(shape: tuple, dtype) -> np.ndarray:
+    """
+        Buffer C-contiguo sin inicializar de la forma y dtype pedidos, reciclado si hay uno libre.
+    """
+    clave = (tuple(shape), np.dtype(dtype))
+    with _lock:
+        libres = _libres.get(clave)
+        if libres:
+            return libres.pop()
+    return np.empty(shape, dtype=dtype)
+
+def release(buf: np.ndarray) -> None:
+    """
+        Devuelve buf al pool. Tras liberarlo el llamador no debe volver a usarlo.
+        Las vistas (buffers que no son dueños de sus datos) se ignoran.
+    """
+    if buf is None or buf.base is not None or not buf.flags['C_CONTIGUOUS']:
+        return
+    clave = (buf.shape, buf.dtype)
+    with _lock:
+        libres = _libres.setdefault(clave, [])
+        if len(libres) < _MAX_POR_CLAVE:
+            libres.append(buf)
+
+def vaciar() -> None:
+    """
+        Descarta todos los buffers libres del pool.
+    """
+    with _lock:
+        _libres.clear()
@@ -1,15 +1,22 @@
 import cv2
 import numpy as np
+import threading
+from .bilateral_u16 import bilateral_u16, njit
+from .._pool import get_buffer
+from ..util import DestinoOpenCL, FiltroPorCortes
 
 # Filtro bilateral 
 
-class Bilateral:
+class Bilateral(FiltroPorCortes):
     nombre = "bilateral"
+    # Cortes con al menos estos píxeles se filtran por OpenCL (UMat) si hay dispositivo disponible
+    MIN_PIXELES_OCL = 1024 * 1024
 
     """
         Filtro bilateral que suaviza las texturas internas, pero permite mantener
         los bordes nitidos evitando desparramiento de la señal.
-        Nota importante: Se requiere la imagen en forma uint8 o float32.
+        Nota importante: uint8 y float32 se filtran directo con OpenCV; uint16 pasa por buffers
+        float32 propios del filtro (o por el núcleo Numba nativo con usar_numba=True).
         Los atributos principales:
         - diam = diametro de la vecinidad (5 para filtro rapido, 9 para offline)
         - sigma_color = Dispersion que a mayor valor, las areas mas distantes se mezclan.
@@ -19,31 +26,77 @@ class Bilateral:
     def __init__(self,
                 diam : int = 3,
                 sigma_color : float = 75, 
-                sigma_espacio : float = 75):
+                sigma_espacio : float = 75,
+                usar_numba : bool = False):
+        """
+            usar_numba : Filtra uint16 con el núcleo Numba de bilateral_u16 en vez de la ruta
+            float32 de OpenCV. Es opcional: evalúa una exponencial por vecino y en cortes
+            grandes resulta más lento que cv2.bilateralFilter; solo evita la conversión.
+        """
 
         self.diam = diam 
         self.sigma_color = sigma_color
         self.sigma_espacio = sigma_espacio
+        if usar_numba and njit is None:
+            raise ImportError("Bilateral con usar_numba=True requiere el paquete numba")
+        self.usar_numba = usar_numba
+        # Buffers float32 de la ruta uint16, reutilizados mientras los cortes tengan la misma forma.
+        # Son por hilo, para poder filtrar varios canales en paralelo con la misma instancia.
+        self._scratch = threading.local()
+        self._ocl = DestinoOpenCL(self.MIN_PIXELES_OCL)
 
 
-    def __call__(self, img : np.ndarray) -> np.ndarray:
+    def __call__(self, img : np.ndarray, dst : np.ndarray = None) -> np.ndarray:
         """
             Nota importante : Si la imagen no se ha transformado a float32 o uint8 o no es
             de ese formato, y es de tipo uint16, se la transformara temporalmente para poder
-            aplicar el filtro.
+            aplicar el filtro. La conversion usa buffers float32 propios del filtro, que se
+            reutilizan entre cortes: a lo largo de un z-stack no se reserva memoria por corte.
+            Si se pasa dst (mismo dtype y forma que img), el resultado se escribe alli; si no,
+            sale del pool de buffers y puede devolverse con _pool.release una vez consumido.
         """
         es_uint16 = img.dtype == np.uint16 
+        if dst is None:
+            dst = get_buffer(img.shape, img.dtype)
+
+        if es_uint16 and self.usar_numba:
+            # Núcleo Numba sobre uint16 (opcional): sin ida y vuelta a float32
+            return bilateral_u16(img, self.diam, self.sigma_color, self.sigma_espacio, out=dst)
 
         if es_uint16:
-            return cv2.bilateralFilter(
-                img.astype(float32), 
-                self.diam, 
-                self.sigma_color, 
-                self.sigma_espacio
-                ).astype(uint16)
+            scratch = self._scratch
+            if getattr(scratch, "f32", None) is None or scratch.f32.shape != img.shape:
+                scratch.f32 = np.empty(img.shape, dtype=np.float32)
+                scratch.out_f32 = np.empty(img.shape, dtype=np.float32)
+            np.copyto(scratch.f32, img, casting='unsafe')
+            self._bilateral_cv2(scratch.f32, scratch.out_f32)
+            np.copyto(dst, scratch.out_f32, casting='unsafe')
+            return dst
         else:
+            return self._bilateral_cv2(img, dst)
+
+    def _bilateral_cv2(self, img: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+        """
+            cv2.bilateralFilter sobre img (uint8 o float32). Los cortes grandes pasan por UMat
+            (OpenCL), con el UMat destino reutilizado por hilo mientras no cambie la forma.
+        """
+        if not self._ocl.usar(img):
             return cv2.bilateralFilter(
                 img, 
                 self.diam,
                 self.sigma_color, 
-                self.sigma_espacio)
\ No newline at end of file
+                self.sigma_espacio,
+                dst=out)
+
+        destino = self._ocl.destino(img)
+        cv2.bilateralFilter(
+            cv2.UMat(img),
+            self.diam,
+            self.sigma_color,
+            self.sigma_espacio,
+            dst=destino)
+        resultado = destino.get()
+        if out is None:
+            return resultado
+        np.copyto(out, resultado)
+        return out
\ No newline at end of file
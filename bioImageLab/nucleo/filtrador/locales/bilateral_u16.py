@@ -0,0 +1,83 @@
+import numpy as np
+from ..._warmup import registrar as registrar_warmup
+
+try:
+    from numba import njit, prange
+except ImportError:  # Numba es opcional: sin él Bilateral(usar_numba=True) no está disponible
+    njit = None
+
+# Filtro bilateral nativo para uint16
+# cv2.bilateralFilter no acepta uint16, lo que obliga a convertir cada corte a float32 y de
+# vuelta. Este núcleo trabaja directamente sobre uint16 en paralelo por filas, con la misma
+# ventana circular y el mismo borde (reflejo 101) que OpenCV. Bilateral lo usa solo con
+# usar_numba=True: la ruta float32 de cv2.bilateralFilter sigue siendo la más rápida.
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True, boundscheck=False)
+    def _bilateral_u16(img, radio, pesos_espacio, inv_2sc2, out):
+        Y, X = img.shape
+        for y in prange(Y):
+            for x in range(X):
+                centro = np.float32(img[y, x])
+                acumulado = np.float32(0.0)
+                peso_total = np.float32(0.0)
+                for i in range(2 * radio + 1):
+                    yy = y + i - radio
+                    # Borde reflejado sin repetir el píxel del borde (BORDER_REFLECT_101)
+                    if yy < 0:
+                        yy = -yy
+                    elif yy >= Y:
+                        yy = 2 * Y - yy - 2
+                    yy = min(max(yy, 0), Y - 1)
+                    for j in range(2 * radio + 1):
+                        w_espacio = pesos_espacio[i, j]
+                        if w_espacio == 0.0:
+                            continue
+                        xx = x + j - radio
+                        if xx < 0:
+                            xx = -xx
+                        elif xx >= X:
+                            xx = 2 * X - xx - 2
+                        xx = min(max(xx, 0), X - 1)
+                        v = np.float32(img[yy, xx])
+                        d = v - centro
+                        w = w_espacio * np.exp(-d * d * inv_2sc2)
+                        acumulado += w * v
+                        peso_total += w
+                out[y, x] = np.uint16(acumulado / peso_total + np.float32(0.5))
+
+def bilateral_u16(img: np.ndarray,
+                  diam: int,
+                  sigma_color: float,
+                  sigma_espacio: float,
+                  out: np.ndarray = None) -> np.ndarray:
+    """
+        Filtro bilateral sobre una imagen 2D uint16 sin conversión a float32.
+
+        Argumentos:
+            img : Imagen (Y, X) uint16
+            diam : Diámetro de la vecindad (<= 0: se deduce de sigma_espacio, como en OpenCV)
+            sigma_color, sigma_espacio : Dispersiones de intensidad y espacial
+            out : Array (Y, X) uint16 destino (opcional)
+
+        Retorna:
+            Imagen filtrada uint16
+    """
+    if njit is None:
+        raise RuntimeError("bilateral_u16 requiere numba")
+
+    radio = diam // 2 if diam > 0 else int(round(sigma_espacio * 1.5))
+    # Tabla de pesos espaciales de la ventana circular, calculada una vez por llamada
+    dy, dx = np.mgrid[-radio:radio + 1, -radio:radio + 1]
+    r2 = (dx * dx + dy * dy).astype(np.float32)
+    pesos_espacio = np.where(r2 <= radio * radio,
+                             np.exp(-r2 / np.float32(2.0 * sigma_espacio * sigma_espacio)),
+                             0.0).astype(np.float32)
+
+    if out is None:
+        out = np.empty(img.shape, dtype=np.uint16)
+    _bilateral_u16(img, radio, pesos_espacio, np.float32(0.5 / (sigma_color * sigma_color)), out)
+    return out
+
+if njit is not None:
+    registrar_warmup(lambda: bilateral_u16(np.zeros((4, 4), dtype=np.uint16), 3, 75.0, 75.0))
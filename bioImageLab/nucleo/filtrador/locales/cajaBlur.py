@@ -1,9 +1,11 @@
 import cv2
 import numpy as np
+from .._pool import get_buffer
+from ..util import FiltroPorCortes
 
 # Filtro Caja
 
-class CajaBlur:
+class CajaBlur(FiltroPorCortes):
     nombre = "caja_blur"
 
     def __init__(self, mascara: tuple[int, int] = (3, 3)):
@@ -16,9 +18,13 @@ class CajaBlur:
         """
         self.mascara = mascara
 
-    def __call__(self, img: np.ndarray) -> np.ndarray:
+    def __call__(self, img: np.ndarray, dst: np.ndarray = None) -> np.ndarray:
         """
-        Aplica el filtro de promedio (blur) sobre la imagen.
+        Aplica el filtro de promedio (blur) sobre la imagen. Sin dst, el resultado sale del
+        pool de buffers y puede devolverse con _pool.release una vez consumido.
         """
-        # cv2.blur es el alias para el filtro de caja normalizado
-        return cv2.blur(img, self.mascara)
\ No newline at end of file
+        if dst is None:
+            dst = get_buffer(img.shape, img.dtype)
+        # cv2.blur es el alias para el filtro de caja normalizado: suma acumulada, O(1) por
+        # píxel sin importar el tamaño de la máscara
+        return cv2.blur(img, self.mascara, dst=dst)
\ No newline at end of file
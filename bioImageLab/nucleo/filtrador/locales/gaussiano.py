@@ -1,11 +1,16 @@
 import cv2
 import numpy as np
 import warnings
+from .._pool import get_buffer
+from ..util import DestinoOpenCL, FiltroPorCortes
 
 # Filtro gaussiano
 
-class Gaussiano:
+class Gaussiano(FiltroPorCortes):
   nombre = "gaussiano"
+  # Cortes con al menos estos píxeles se filtran por OpenCL (UMat) si hay dispositivo disponible;
+  # en cortes chicos la transferencia host-dispositivo cuesta más que la convolución
+  MIN_PIXELES_OCL = 1024 * 1024
 
   """
     Funcion atomica de filtrado gaussiano que permite un suavizado espacial general de los pixeles,
@@ -29,6 +34,10 @@ class Gaussiano:
     """
     self.sigma = sigma
     self.mascara = self._chequear_mascara(mascara)
+    # Núcleos 1D precalculados para uint8, donde sepFilter2D le gana a GaussianBlur (~10-20 %).
+    # En uint16 (el dtype principal) y float32 GaussianBlur es igual o hasta ~3x más rápido.
+    self._nucleos_8u = self._calcular_nucleos()
+    self._ocl = DestinoOpenCL(self.MIN_PIXELES_OCL)
 
   def _chequear_mascara(self, mascara: tuple[int, int]) -> tuple[int, int]:
         """
@@ -54,5 +63,41 @@ class Gaussiano:
             
         return (nuevo_ancho, nuevo_alto)
 
-  def __call__(self, img: np.ndarray) -> np.ndarray:
-    return cv2.GaussianBlur(img, self.mascara, self.sigma)
\ No newline at end of file
+  def _calcular_nucleos(self) -> tuple[np.ndarray, np.ndarray]:
+    """
+      Núcleos gaussianos 1D (x, y) equivalentes a los que arma cv2.GaussianBlur para uint8
+      (con mascara (0,0) OpenCV deduce el tamaño de sigma con 3 sigmas en 8 bits).
+    """
+    por_sigma = int(round(self.sigma * 3 * 2 + 1)) | 1
+    ancho, alto = (tam if tam > 0 else por_sigma for tam in self.mascara)
+    return (cv2.getGaussianKernel(ancho, self.sigma, ktype=cv2.CV_32F),
+            cv2.getGaussianKernel(alto, self.sigma, ktype=cv2.CV_32F))
+
+  def __call__(self, img: np.ndarray, dst: np.ndarray = None) -> np.ndarray:
+    """
+      Sin dst, el resultado sale del pool de buffers y puede devolverse con _pool.release.
+    """
+    if dst is None:
+      dst = get_buffer(img.shape, img.dtype)
+    if self._ocl.usar(img):
+      return self._filtrar_ocl(img, dst)
+    return self._filtrar(img, dst, img.dtype == np.uint8)
+
+  def _filtrar(self, img, dst, es_8u: bool):
+    """
+      sepFilter2D con los núcleos precalculados en uint8; GaussianBlur en el resto.
+      img y dst pueden ser ndarray o UMat.
+    """
+    if es_8u:
+      kx, ky = self._nucleos_8u
+      return cv2.sepFilter2D(img, -1, kx, ky, dst=dst)
+    return cv2.GaussianBlur(img, self.mascara, self.sigma, dst=dst)
+
+  def _filtrar_ocl(self, img: np.ndarray, dst: np.ndarray) -> np.ndarray:
+    """
+      Filtrado sobre UMat (OpenCL transparente), con el UMat destino reutilizado por hilo.
+    """
+    destino = self._ocl.destino(img)
+    self._filtrar(cv2.UMat(img), destino, img.dtype == np.uint8)
+    np.copyto(dst, destino.get())
+    return dst
\ No newline at end of file
@@ -0,0 +1,112 @@
+import cv2
+import threading
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # Numba es opcional: sin él jit_filter no está disponible
+    njit = None
+
+# Filtros locales definidos por el usuario
+# Un operador por ventana escrito en Python (p. ej. con scipy generic_filter) paga una llamada
+# del intérprete por píxel. jit_filter compila el operador y el recorrido de la imagen con
+# Numba, en paralelo por filas.
+
+def jit_filter(func):
+    """
+        Convierte func(ventana) -> escalar, con ventana un array 2D (alto, ancho), en un filtro
+        local compilado: filtro(img, tamano) evalúa func sobre la vecindad de cada píxel.
+
+        Argumentos:
+            func : Función compatible con Numba (modo nopython) que reduce la ventana a un valor
+
+        Retorna:
+            filtro(img, tamano=(3, 3), out=None) -> Imagen 2D float64 (o el dtype de out).
+            El borde se trata por reflejo sin repetir el píxel del borde (BORDER_REFLECT_101).
+    """
+    if njit is None:
+        raise RuntimeError("jit_filter requiere numba")
+
+    reduccion = njit(func)
+
+    @njit(parallel=True, cache=False)
+    def _recorrer(pad, alto, ancho, out):
+        Y, X = out.shape
+        for y in prange(Y):
+            for x in range(X):
+                out[y, x] = reduccion(pad[y:y + alto, x:x + ancho])
+
+    def filtro(img: np.ndarray, tamano: tuple[int, int] = (3, 3), out: np.ndarray = None) -> np.ndarray:
+        ancho, alto = tamano
+        if ancho % 2 == 0 or alto % 2 == 0:
+            raise ValueError("El tamaño de la ventana debe ser impar")
+        if out is None:
+            out = np.empty(img.shape, dtype=np.float64)
+        pad = np.pad(img, ((alto // 2, alto // 2), (ancho // 2, ancho // 2)), mode='reflect')
+        _recorrer(pad, alto, ancho, out)
+        return out
+
+    filtro.__name__ = getattr(func, "__name__", "jit_filter")
+    filtro.__doc__ = func.__doc__
+    return filtro
+
+
+class FiltroPorCortes:
+    """
+        Mixin de los filtros locales 2D (CajaBlur, Gaussiano, Bilateral): aplica el filtro a una
+        pila de cortes llamando a filtro(plano, dst=...) por cada uno.
+    """
+
+    def apply_stack(self, pila: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+        """
+            Aplica el filtro a una pila de cortes (..., Y, X), por ejemplo un canal completo
+            (T, Z, Y, X), en una sola llamada. Los cortes se recorren sobre una vista (N, Y, X)
+            y cada resultado se escribe directamente en out, sin reservar un array por corte.
+
+            Argumentos:
+                pila : Array (..., Y, X)
+                out : Array C-contiguo de la misma forma y dtype (opcional)
+        """
+        Y, X = pila.shape[-2:]
+        if out is None:
+            out = np.empty(pila.shape, dtype=pila.dtype)
+        elif not out.flags['C_CONTIGUOUS']:
+            raise ValueError("out debe ser C-contiguo")
+        planos, salida = pila.reshape(-1, Y, X), out.reshape(-1, Y, X)
+        for i in range(planos.shape[0]):
+            self(planos[i], dst=salida[i])
+        return out
+
+
+class DestinoOpenCL:
+    """
+        Ruta OpenCL (UMat) de los filtros locales. Solo consulta si hay dispositivo
+        (cv2.ocl.haveOpenCL) y si el proceso lo tiene activo (cv2.ocl.useOpenCL), sin cambiar ese
+        estado global. Guarda un UMat destino por hilo, reutilizado mientras los cortes tengan la
+        misma forma y dtype: a lo largo de un z-stack solo se transfieren el corte y su resultado.
+    """
+
+    def __init__(self, min_pixeles: int):
+        """
+            min_pixeles : Cortes más chicos se filtran en CPU: la transferencia host-dispositivo
+            cuesta más que el filtro.
+        """
+        self.min_pixeles = min_pixeles
+        self.disponible = cv2.ocl.haveOpenCL()
+        self._local = threading.local()
+
+    def usar(self, img: np.ndarray) -> bool:
+        """
+            True si img debe filtrarse por OpenCL.
+        """
+        return self.disponible and img.size >= self.min_pixeles and cv2.ocl.useOpenCL()
+
+    def destino(self, img: np.ndarray) -> cv2.UMat:
+        """
+            UMat destino del hilo actual para cortes de la forma y dtype de img.
+        """
+        local = self._local
+        clave = (img.shape, img.dtype)
+        if getattr(local, "clave", None) != clave:
+            local.clave, local.umat = clave, cv2.UMat(img)
+        return local.umat
\ No newline at end of file
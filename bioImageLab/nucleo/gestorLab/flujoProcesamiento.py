@@ -1,3 +1,94 @@
+import array
+import hashlib
+import time
+import numpy as np
+from collections import OrderedDict, deque
+from typing import Dict, List, Optional
+
+# Fusiones de operaciones adyacentes: (tipo_a, tipo_b) -> fabrica(op_a, op_b) del operador
+# fusionado. Los módulos que definen operadores fusionados se registran al importarse.
+_FUSIONES: Dict[tuple, object] = {}
+
+def registrar_fusion(tipo_a: type, tipo_b: type, fabrica):
+    """
+        Registra que op_a (de tipo exacto tipo_a) seguida de op_b (tipo_b) puede reemplazarse en
+        un flujo encadenado por fabrica(op_a, op_b), que recorre los datos una sola vez.
+    """
+    _FUSIONES[(tipo_a, tipo_b)] = fabrica
+
+def _fusionar_adyacentes(ops: list) -> list:
+    fusionadas = []
+    for op in ops:
+        if fusionadas:
+            fabrica = _FUSIONES.get((type(fusionadas[-1]), type(op)))
+            if fabrica is not None:
+                fusionadas[-1] = fabrica(fusionadas[-1], op)
+                continue
+        fusionadas.append(op)
+    return fusionadas
+
+class CacheLRU:
+    """
+        Caché LRU de resultados de operaciones, compartida entre ramas y acotada en bytes.
+        La clave es (clase de la operación, parámetros, huella de la entrada): una rama que
+        repite la misma operación sobre la misma imagen recibe el ndarray ya calculado
+        (el mismo objeto, que no debe modificarse in-place).
+    """
+
+    def __init__(self, presupuesto_bytes: int = 1 << 30):
+        self.presupuesto_bytes = presupuesto_bytes
+        self._entradas: OrderedDict = OrderedDict()
+        self._bytes = 0
+
+    @staticmethod
+    def clave(operacion, img: np.ndarray) -> tuple:
+        # Una operación que guarda su configuración en atributos privados (p. ej. propiedades)
+        # la declara con clave_cache(); si no, sus atributos públicos son los parámetros
+        clave_cache = getattr(operacion, "clave_cache", None)
+        if clave_cache is not None:
+            parametros = tuple(_firma(v) for v in clave_cache())
+        else:
+            # Los atributos privados son cachés internas de la operación (núcleos, buffers), no parámetros
+            parametros = tuple(sorted(
+                (k, _firma(v)) for k, v in operacion.__dict__.items() if not k.startswith("_")
+            ))
+        return (operacion.__class__.__name__, parametros, _firma(img))
+
+    def get(self, clave):
+        resultado = self._entradas.get(clave)
+        if resultado is not None:
+            self._entradas.move_to_end(clave)
+        return resultado
+
+    def put(self, clave, resultado: np.ndarray):
+        # Solo se guardan ndarray: una operación que falla y retorna None (p. ej. Normalizador)
+        # no se cachea y se vuelve a intentar en la próxima llamada
+        if not isinstance(resultado, np.ndarray):
+            return
+        if clave in self._entradas:
+            self._bytes -= self._entradas.pop(clave).nbytes
+        self._entradas[clave] = resultado
+        self._bytes += resultado.nbytes
+        while self._bytes > self.presupuesto_bytes and len(self._entradas) > 1:
+            _, viejo = self._entradas.popitem(last=False)
+            self._bytes -= viejo.nbytes
+
+def _firma(valor):
+    """
+        Valor hashable que identifica un parámetro o una entrada. Los ndarray se resumen con
+        forma, dtype y un hash BLAKE2b de todo el buffer: una pasada de lectura O(N), pero una
+        escritura in-place en cualquier posición cambia la firma (no hay aciertos obsoletos).
+    """
+    if isinstance(valor, np.ndarray):
+        # ascontiguousarray no copia si el array ya es contiguo (el caso habitual)
+        h = hashlib.blake2b(memoryview(np.ascontiguousarray(valor)).cast("B"), digest_size=16)
+        return (valor.shape, valor.dtype.str, h.hexdigest())
+    try:
+        hash(valor)
+    except TypeError:
+        return repr(valor)
+    return valor
+
 class FlujoProcesamiento:
     """
         Clase que gestiona un flujo de operaciones atomicas de filtrado, suavizado, segmentacion y deteccion
@@ -15,18 +106,131 @@ class FlujoProcesamiento:
             }
     """
 
-    def __init__(self, img: np.ndarray):
+    def __init__(self, img: np.ndarray, cache: Optional[CacheLRU] = None):
         self.img_original = img
+        # Caché de resultados opcional, normalmente compartida por GestorRamas
+        self.cache = cache
         self.procesados : Dict[str, np.ndarray] = {}
-        self.operaciones : List[dict] = []
+        # Registro de operaciones en listas paralelas (nombre, parámetros, segundos) en lugar
+        # de un dict por operación; la propiedad operaciones lo reconstruye a demanda
+        self._op_names : List[str] = []
+        self._op_params : List[dict] = []
+        self._op_times = array.array('d')
+
+    @property
+    def operaciones(self) -> List[dict]:
+        return [
+            {"operacion" : nombre, "parametros" : parametros, "segundos" : segundos}
+            for nombre, parametros, segundos in zip(self._op_names, self._op_params, self._op_times)
+        ]
+
+    def _registrar(self, operacion, segundos: float):
+        self._op_names.append(operacion.__class__.__name__)
+        self._op_params.append(operacion.__dict__)
+        self._op_times.append(segundos)
+
+    def ejecutar(self, nombre: str, operacion, store: bool = True):
+        """
+            Aplica la operacion sobre la imagen original. Con store=False el resultado no se
+            guarda en procesados (solo se retorna), para no retener un MultiArray por paso.
+        """
+        inicio = time.perf_counter()
+        if self.cache is None:
+            resultado = operacion(self.img_original)
+        else:
+            clave = self.cache.clave(operacion, self.img_original)
+            resultado = self.cache.get(clave)
+            if resultado is None:
+                resultado = operacion(self.img_original)
+                self.cache.put(clave, resultado)
+        if store:
+            self.procesados[nombre] = resultado
+
+        self._registrar(operacion, time.perf_counter() - inicio)
+
+        return resultado
 
-    def ejecutar(self, nombre: str, operacion):
-        resultado = operacion(self.img_original)
-        self.procesados[nombre] = resultado
+    def ejecutar_stream(self, ops: list, nombre: Optional[str] = None, store: bool = True) -> np.ndarray:
+        """
+            Encadena ops (operaciones 2D sobre cortes (Y, X)) recorriendo el MultiArray
+            [T, Z, C, Y, X] corte a corte a lo largo de Z: cada corte atraviesa todas las
+            operaciones antes de leer el siguiente y solo se materializa la salida final. En
+            memoria viven, ademas de la salida, las ventanas de las operaciones (z_footprint
+            cortes por operacion) en lugar de un volumen completo por paso intermedio.
 
-        self.operaciones.append({
-            "operacion" : operacion.__clas__.__name__,
-            "parametros" : operacion.__dict__
-        })
+            Una operacion con atributo z_footprint = f > 1 (impar) recibe en cada corte la pila
+            (f, Y, X) centrada en z, con borde replicado, y debe retornar el corte 2D.
+            Los pares adyacentes con una fusion registrada (registrar_fusion) se ejecutan como
+            un unico operador fusionado; el registro conserva las operaciones originales.
+
+            Argumentos:
+                ops : Lista de operaciones en orden de aplicacion
+                nombre : Clave de la salida en procesados (default: nombres unidos por "+")
+                store : Si False, la salida no se guarda en procesados
+
+            Retorna:
+                MultiArray [T, Z, C, Y, X] con la salida de la ultima operacion
+        """
+        img = self.img_original
+        if img.ndim != 5:
+            raise ValueError("ejecutar_stream requiere el MultiArray 5D [T, Z, C, Y, X]")
+        T, Z, C = img.shape[:3]
+
+        inicio = time.perf_counter()
+        etapas = _fusionar_adyacentes(ops)
+        salida = None
+        for t in range(T):
+            for c in range(C):
+                cortes = (img[t, z, c] for z in range(Z))
+                for op in etapas:
+                    cortes = _etapa(op, cortes)
+                for z, corte in enumerate(cortes):
+                    if salida is None:
+                        # El dtype y la forma de salida los fija la ultima operacion
+                        salida = np.empty((T, Z, C) + corte.shape, dtype=corte.dtype)
+                    salida[t, z, c] = corte
+
+        # Las etapas corren intercaladas: el tiempo total se reparte en partes iguales
+        segundos = (time.perf_counter() - inicio) / max(len(ops), 1)
+        for op in ops:
+            self._registrar(op, segundos)
+        if store:
+            clave = nombre if nombre is not None else "+".join(getattr(op, "nombre", op.__class__.__name__) for op in ops)
+            self.procesados[clave] = salida
+        return salida
+
+def _etapa(op, cortes):
+    """
+        Generador de una etapa del flujo: aplica op a cada corte que llega de la etapa anterior.
+        Con z_footprint = f > 1 (impar) mantiene una ventana deslizante de f cortes y entrega
+        op(ventana), siempre de forma (f, Y, X), a medida que se completan (retraso de f // 2
+        cortes, borde replicado en ambos extremos, aun si la pila tiene menos de f // 2 cortes).
+    """
+    f = getattr(op, "z_footprint", 1)
+    if f <= 1:
+        for corte in cortes:
+            yield op(corte)
+        return
+    if f % 2 == 0:
+        raise ValueError(f"z_footprint debe ser impar (ventana centrada en z), es {f}")
 
-        return resultado
\ No newline at end of file
+    radio = f // 2
+    ventana = deque(maxlen=f)
+    n = 0
+    emitidos = 0
+    for corte in cortes:
+        if n == 0:
+            ventana.extend([corte] * (radio + 1))
+        else:
+            ventana.append(corte)
+        n += 1
+        if len(ventana) == f:
+            yield op(np.stack(ventana))
+            emitidos += 1
+    # Cola: se replica el ultimo corte hasta llenar la ventana (pilas con menos de radio cortes)
+    # y hasta entregar un resultado por cada corte de entrada
+    while emitidos < n:
+        ventana.append(ventana[-1])
+        if len(ventana) == f:
+            yield op(np.stack(ventana))
+            emitidos += 1
@@ -1,11 +1,22 @@
-from flujoProcesamiento import FlujoProcesamiento
+import weakref
+from .flujoProcesamiento import FlujoProcesamiento, CacheLRU
 
 class GestorRamas:
-    def __init__(self, img):
-        self.ramas = {}
+    def __init__(self, img, presupuesto_cache: int = 1 << 30):
+        self.img = img
+        # Referencias débiles: la rama vive mientras el llamador conserve el flujo que retorna
+        # nueva_rama; al soltarlo se liberan sus procesados sin esperar al gestor
+        self.ramas = weakref.WeakValueDictionary()
+        # Resultados compartidos entre ramas: la misma operación sobre la misma entrada se calcula una vez
+        self._cache = CacheLRU(presupuesto_cache)
 
-    def nueva_rama(self, nombre):
-        self.ramas[nombre] = FlujoProcesamiento(img)
+    def nueva_rama(self, nombre) -> FlujoProcesamiento:
+        flujo = FlujoProcesamiento(self.img, cache=self._cache)
+        self.ramas[nombre] = flujo
+        return flujo
 
     def ejecutar(self, rama, nombre_op, operacion):
-        return self.ramas[rama].ejecutar(nombre_op, operacion)
\ No newline at end of file
+        flujo = self.ramas.get(rama)
+        if flujo is None:
+            raise KeyError(f"La rama '{rama}' no existe o fue liberada (conservar el flujo que retorna nueva_rama)")
+        return flujo.ejecutar(nombre_op, operacion)
\ No newline at end of file
@@ -1,5 +1,37 @@
 import numpy as np
 from itertools import combinations_with_replacement
+from ..._warmup import registrar as registrar_warmup
+
+try:
+    from numba import njit, prange
+except ImportError:  # Numba es opcional: sin él la superficie se evalúa con productos matriciales
+    njit = None
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _evaluar_numba(C, xs, ys, out):
+        """
+            out[r, c] = sum C[j, i] * xs[c]**i * ys[r]**j. Por fila se reducen primero las
+            potencias de y a un polinomio en x (coeficientes a_i) y cada píxel se evalúa por
+            Horner: d multiplicaciones-suma por píxel, sin potencias ni tablas de la grilla.
+        """
+        d = C.shape[0] - 1
+        for r in prange(ys.shape[0]):
+            a = np.zeros(d + 1)
+            yp = 1.0
+            for j in range(d + 1):
+                for i in range(d + 1 - j):
+                    a[i] += C[j, i] * yp
+                yp *= ys[r]
+            for c in range(xs.shape[0]):
+                x = xs[c]
+                s = a[d]
+                for i in range(d - 1, -1, -1):
+                    s = s * x + a[i]
+                out[r, c] = s
+
+    registrar_warmup(lambda: _evaluar_numba(
+        np.zeros((3, 3)), np.linspace(0.0, 1.0, 4), np.linspace(0.0, 1.0, 4), np.empty((4, 4))))
 
 
 class AjusteSuperficie:
@@ -11,6 +43,9 @@ class AjusteSuperficie:
     """
 
     nombre = "ajuste_superficie"
+    # Hasta este grado se resuelven las ecuaciones normales por Cholesky; por encima A^T A
+    # puede quedar mal condicionada y se usa lstsq (SVD)
+    GRADO_MAX_CHOLESKY = 4
 
     def __init__(self, grado: int = 2):
         if grado < 0:
@@ -35,39 +70,81 @@ class AjusteSuperficie:
             Superficie polinómica ajustada.
         """
         h, w = img.shape
-        y, x = np.mgrid[:h, :w]
-
-        x = x.ravel()
-        y = y.ravel()
-        z = img.ravel()
+        # Coordenadas 1D de columnas y filas, escaladas a [0, 1] para acotar el condicionamiento:
+        # la grilla completa es su producto
+        xs = np.arange(w, dtype=np.float64) / max(w - 1, 1)
+        ys = np.arange(h, dtype=np.float64) / max(h - 1, 1)
 
-        if mask is not None:
-            mask = mask.ravel()
-            x = x[mask]
-            y = y[mask]
-            z = z[mask]
+        if mask is None:
+            x = np.tile(xs, h)
+            y = np.repeat(ys, w)
+            z = img.ravel()
+        else:
+            filas, columnas = np.nonzero(mask)
+            x = xs[columnas]
+            y = ys[filas]
+            z = img[mask]
 
         # Construir matriz de diseño
         A = self._design_matrix(x, y)
 
         # Ajuste por mínimos cuadrados
-        coeffs, _, _, _ = np.linalg.lstsq(A, z, rcond=None)
+        coeffs = self._resolver(A, z)
+
+        # Evaluar el polinomio en toda la imagen como producto tensorial:
+        # fondo = Py @ C @ Px.T, con C[j, i] el coeficiente de x**i * y**j. No se arma la
+        # matriz de diseño de H*W x n_terminos de la grilla completa.
+        d = self.grado
+        C = np.zeros((d + 1, d + 1), dtype=coeffs.dtype)
+        k = 0
+        for i in range(d + 1):
+            for j in range(d + 1 - i):
+                C[j, i] = coeffs[k]
+                k += 1
+        if njit is not None:
+            fondo = np.empty((h, w), dtype=np.float64)
+            _evaluar_numba(C.astype(np.float64), xs, ys, fondo)
+            return fondo
 
-        # Evaluar el polinomio en toda la imagen
-        A_full = self._design_matrix(
-            np.mgrid[:h, :w][1].ravel(),
-            np.mgrid[:h, :w][0].ravel()
-        )
+        Px = np.vander(xs, d + 1, increasing=True)
+        Py = np.vander(ys, d + 1, increasing=True)
 
-        fondo = (A_full @ coeffs).reshape(h, w)
+        fondo = (Py @ C) @ Px.T
         return fondo
 
+    def _resolver(self, A: np.ndarray, z: np.ndarray) -> np.ndarray:
+        """
+        Coeficientes de mínimos cuadrados de A @ c = z. Para grados bajos resuelve las
+        ecuaciones normales A^T A c = A^T z por Cholesky: A^T A es de n_terminos x n_terminos
+        (15 x 15 para grado 4) y se arma con un solo producto, en lugar de la SVD de la
+        matriz alta de H*W filas.
+        """
+        if self.grado <= self.GRADO_MAX_CHOLESKY:
+            AtA = A.T @ A
+            Atz = A.T @ z
+            # Ridge mínimo relativo a la diagonal, por estabilidad numérica
+            AtA[np.diag_indices_from(AtA)] += 1e-12 * np.trace(AtA) / AtA.shape[0]
+            try:
+                L = np.linalg.cholesky(AtA)
+                return np.linalg.solve(L.T, np.linalg.solve(L, Atz))
+            except np.linalg.LinAlgError:
+                pass
+        coeffs, _, _, _ = np.linalg.lstsq(A, z, rcond=None)
+        return coeffs
+
     def _design_matrix(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
         """
         Construye la matriz de diseño para el ajuste polinómico.
+        Las potencias de x e y se calculan una sola vez (Vandermonde 1D) y cada término
+        x**i * y**j se escribe directamente en su columna de A, sin temporales ni vstack.
         """
-        terms = []
-        for i in range(self.grado + 1):
-            for j in range(self.grado + 1 - i):
-                terms.append((x ** i) * (y ** j))
-        return np.vstack(terms).T
\ No newline at end of file
+        d = self.grado
+        Vx = np.vander(x, d + 1, increasing=True)
+        Vy = np.vander(y, d + 1, increasing=True)
+        A = np.empty((x.size, (d + 1) * (d + 2) // 2), dtype=np.float64)
+        k = 0
+        for i in range(d + 1):
+            for j in range(d + 1 - i):
+                np.multiply(Vx[:, i], Vy[:, j], out=A[:, k])
+                k += 1
+        return A
\ No newline at end of file
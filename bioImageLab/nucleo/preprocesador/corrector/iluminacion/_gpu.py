@@ -0,0 +1,37 @@
+try:
+    import cupy as cp
+except ImportError:  # CuPy es opcional: sin él solo está disponible el backend "cpu"
+    cp = None
+
+try:
+    from cucim.skimage.restoration import rolling_ball as rolling_ball_cuda
+except ImportError:  # cuCIM es opcional: RollingBall en "cuda" lo requiere
+    rolling_ball_cuda = None
+
+# Backend de cómputo de las correcciones de iluminación
+# "cuda" mueve cada corte a la GPU y trae el resultado de vuelta: la transferencia por PCIe
+# (ida y vuelta de Y*X píxeles) solo se amortiza en cortes grandes con radios o sigmas grandes;
+# en imágenes chicas "cpu" es más rápido.
+
+_BACKENDS = {"cpu", "cuda"}
+_backend = "cpu"
+
+def configurar_backend(backend: str):
+    """
+        Fija el backend por defecto ("cpu" o "cuda") de las operaciones creadas sin backend
+        explícito, por ejemplo para pasar a GPU un flujo completo de GestorRamas.
+    """
+    global _backend
+    _backend = resolver_backend(backend)
+
+def resolver_backend(backend: str = None) -> str:
+    """
+        Valida backend (None: el configurado por defecto) y verifica que CuPy esté disponible
+        para "cuda".
+    """
+    backend = _backend if backend is None else backend
+    if backend not in _BACKENDS:
+        raise ValueError(f"Backend desconocido: {backend}. Opciones: {sorted(_BACKENDS)}")
+    if backend == "cuda" and cp is None:
+        raise ImportError("El backend 'cuda' requiere el paquete cupy")
+    return backend
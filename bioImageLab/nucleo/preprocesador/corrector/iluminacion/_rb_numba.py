@@ -0,0 +1,121 @@
+import cv2
+import numpy as np
+from ...._warmup import registrar as registrar_warmup
+
+try:
+    from numba import njit, prange
+except ImportError:  # Numba es opcional: sin él RollingBall usa OpenCV o scikit-image
+    njit = None
+
+# Fondo por apertura morfológica con Numba, tolerante a NaN
+# La apertura (erosión y luego dilatación) usa el mismo disco que la ruta de OpenCV de
+# RollingBall (MORPH_ELLIPSE de radio r / f sobre la imagen reducida f veces), de modo que el
+# fondo no dependa del dtype ni de los NaN. El disco se descompone en filas: la erosión es el
+# mínimo, sobre los desplazamientos verticales, de mínimos deslizantes horizontales del ancho
+# de cada fila, con el algoritmo de van Herk/Gil-Werman, O(1) por píxel sin importar el ancho.
+# Los NaN se ignoran dentro de la ventana y se conservan en el fondo.
+
+if njit is not None:
+    @njit(nogil=True, cache=True)
+    def _min_linea(linea, r, pad, g, h, out):
+        n = linea.shape[0]
+        k = 2 * r + 1
+        m = n + 2 * r
+        for i in range(m):
+            pad[i] = np.inf
+        for i in range(n):
+            v = linea[i]
+            # NaN (v != v) no participa del mínimo
+            pad[r + i] = v if v == v else np.inf
+        # Mínimos acumulados hacia adelante (g) y hacia atrás (h) dentro de bloques de k
+        for i in range(m):
+            g[i] = pad[i] if i % k == 0 else min(g[i - 1], pad[i])
+        for i in range(m - 1, -1, -1):
+            h[i] = pad[i] if (i == m - 1 or (i + 1) % k == 0) else min(h[i + 1], pad[i])
+        for i in range(n):
+            out[i] = min(h[i], g[i + 2 * r])
+
+    @njit(parallel=True, nogil=True, cache=True)
+    def _min_disco(src, semianchos, signo):
+        """
+            Mínimo de signo * src (signo = -1 da el máximo negado) sobre el disco cuya fila
+            d - R tiene semiancho semianchos[d]. Fuera de la imagen y en los NaN no hay datos;
+            un píxel sin ningún valor válido en su ventana queda en NaN.
+        """
+        Y, X = src.shape
+        R = semianchos.shape[0] // 2
+        m = X + 2 * semianchos.max()
+        dst = np.empty((Y, X), dtype=np.float64)
+        for y in prange(Y):
+            linea = np.empty(X, dtype=np.float64)
+            fila = np.empty(X, dtype=np.float64)
+            acumulado = np.full(X, np.inf)
+            pad = np.empty(m, dtype=np.float64)
+            g = np.empty(m, dtype=np.float64)
+            h = np.empty(m, dtype=np.float64)
+            for d in range(-R, R + 1):
+                yy = y + d
+                if yy < 0 or yy >= Y:
+                    continue
+                for x in range(X):
+                    linea[x] = signo * src[yy, x]
+                _min_linea(linea, semianchos[d + R], pad, g, h, fila)
+                for x in range(X):
+                    if fila[x] < acumulado[x]:
+                        acumulado[x] = fila[x]
+            for x in range(X):
+                dst[y, x] = acumulado[x] if acumulado[x] < np.inf else np.nan
+        return dst
+
+    # Corte float64, como lo llama rolling_ball_numba
+    registrar_warmup(lambda: _min_disco(np.zeros((4, 4)), np.ones(3, dtype=np.int64), 1.0))
+
+def _reducir_nan(img: np.ndarray, f: int) -> np.ndarray:
+    """
+        Reducción INTER_AREA a la grilla (h // f, w // f) de RollingBall._fondo_cv2 ignorando
+        NaN. INTER_AREA es lineal, así que el promedio de área de los píxeles válidos es el
+        cociente entre la reducción de la imagen con los NaN en cero y la de su máscara de
+        validez: los mismos pesos de OpenCV. Las celdas sin datos quedan en NaN.
+    """
+    h, w = img.shape
+    tam = (max(1, w // f), max(1, h // f))
+    validos = ~np.isnan(img)
+    suma = cv2.resize(np.where(validos, img, 0.0), tam, interpolation=cv2.INTER_AREA)
+    cuenta = cv2.resize(validos.astype(np.float64), tam, interpolation=cv2.INTER_AREA)
+    return np.divide(suma, cuenta, out=np.full(suma.shape, np.nan), where=cuenta > 0)
+
+def rolling_ball_numba(img: np.ndarray, elemento: np.ndarray, factor: int = 1) -> np.ndarray:
+    """
+        Fondo de img (2D) por apertura en escala de grises con el elemento estructurante
+        elíptico de RollingBall, sobre la imagen reducida factor veces.
+
+        Argumentos:
+            img : Imagen 2D de cualquier dtype numérico (puede contener NaN)
+            elemento : Elemento de cv2.getStructuringElement(MORPH_ELLIPSE, ...) de lado impar
+            factor : Factor de reducción (1: resolución completa)
+
+        Retorna:
+            Fondo acotado a img, con NaN donde img es NaN, en el dtype de img si es flotante
+            (float64 si no), como la ruta de OpenCV
+    """
+    if njit is None:
+        raise RuntimeError("rolling_ball_numba requiere numba")
+
+    # Semiancho de cada fila del disco (las filas de MORPH_ELLIPSE son tramos centrados)
+    semianchos = (elemento.sum(axis=1) // 2).astype(np.int64)
+    datos = img.astype(np.float64, copy=False)
+    h, w = datos.shape
+    reducida = _reducir_nan(datos, factor) if factor > 1 else datos
+
+    # Erosión y dilatación (mínimo del negado) con el mismo disco
+    fondo = _min_disco(_min_disco(reducida, semianchos, 1.0), semianchos, -1.0)
+    np.negative(fondo, out=fondo)
+    if factor > 1:
+        fondo = cv2.resize(fondo, (w, h), interpolation=cv2.INTER_LINEAR)
+
+    # Como en la ruta de OpenCV, el fondo se acota a la imagen (fmin ignora los NaN)
+    np.fmin(fondo, datos, out=fondo)
+    if np.issubdtype(img.dtype, np.floating):
+        fondo[np.isnan(img)] = np.nan
+        fondo = fondo.astype(img.dtype, copy=False)
+    return fondo
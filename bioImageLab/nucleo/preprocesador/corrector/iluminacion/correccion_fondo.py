@@ -36,10 +36,24 @@ class CorreccionFondoReal(CorreccionFondo):
 
     def __init__(self, master_dark: np.ndarray):
         self.dark = master_dark
+        # Campo oscuro convertido al dtype de las imágenes, una vez por dtype y no por llamada
+        self._dark_por_dtype = {}
+
+    def _dark_en(self, dtype) -> np.ndarray:
+        dark = self._dark_por_dtype.get(dtype)
+        if dark is None:
+            dark = self._dark_por_dtype[dtype] = np.asarray(self.dark).astype(dtype)
+        return dark
 
     def __call__(self, img: np.ndarray) -> np.ndarray:
         # Resta con clipping para no tener valores negativos
-        return np.maximum(img.astype(np.int32) - self.dark.astype(np.int32), 0).astype(img.dtype)
+        dark = self._dark_en(img.dtype)
+        if img.dtype in (np.uint8, np.uint16) and img.ndim == 2 and dark.shape == img.shape:
+            # Resta saturada de OpenCV: una pasada SIMD en el dtype de entrada
+            return cv2.subtract(img, dark)
+        # max(img, dark) - dark == max(img - dark, 0) sin salir del dtype: un solo array
+        out = np.maximum(img, dark)
+        return np.subtract(out, dark, out=out)
 
 class CorreccionFondoEstimada(CorreccionFondo):
     nombre = "correccion_fondo_estimada"
@@ -55,4 +69,6 @@ class CorreccionFondoEstimada(CorreccionFondo):
         self.estimador = RollingBall(radio=radio)
 
     def __call__(self, img: np.ndarray) -> np.ndarray:
-        return np.maximum(self.estimador(img).astype(np.float64), 0)
\ No newline at end of file
+        # El estimador ya retorna un array propio: se recorta en el lugar, sin otra copia
+        fondo = self.estimador(img).astype(np.float64, copy=False)
+        return np.maximum(fondo, 0, out=fondo)
\ No newline at end of file
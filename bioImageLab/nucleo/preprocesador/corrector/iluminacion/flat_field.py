@@ -15,7 +15,10 @@
 
 import numpy as np
 import cv2
-from ...filtradores.locales.gaussiano import Gaussiano
+from ....filtrador.locales.gaussiano import Gaussiano
+from ._gpu import cp, resolver_backend
+from ...normalizador.metodosNormalizacion import MinMaxNorm
+from ....gestorLab.flujoProcesamiento import registrar_fusion
 
 class FlatField:
     nombre = "base_flat_field"
@@ -36,35 +39,101 @@ class FlatFieldReal(FlatField):
             Se asume que master_flat y master_dark ya vienen procesados/normalizados 
             si así se requiere externamente.
         """
-        self.F = master_flat.astype(np.float64)
-        self.D = master_dark.astype(np.float64) if master_dark is not None else 0.0
+        # Los campos de referencia son suaves y de bajo rango dinámico: se guardan en float32,
+        # la mitad de bytes por pixel leídos en cada corrección
+        self.F = master_flat.astype(np.float32)
+        self.D = master_dark.astype(np.float32) if master_dark is not None else 0.0
+
+        # F y D son constantes: el inverso del denominador y la máscara se calculan una sola vez
+        # (en float64 y luego guardados en float32). Donde el denominador no es positivo se
+        # conserva la identidad (escala 1, sin restar D).
+        denominador = np.subtract(self.F, self.D, dtype=np.float64)
+        self._valido = denominador > 0
+        self._inv_den = np.divide(1.0, denominador, out=np.ones_like(denominador),
+                                  where=self._valido).astype(np.float32)
+        self._desplazamiento = (np.where(self._valido, self.D, 0.0).astype(np.float32)
+                                if master_dark is not None else None)
+
+    def _dtype_salida(self, img: np.ndarray):
+        # float32 para imágenes de hasta 16 bits (y float32); float64 si la entrada lo requiere
+        return np.result_type(img.dtype, np.float32)
 
     def __call__(self, img: np.ndarray) -> np.ndarray:
-        # Operación atómica pura
-        img_flat = img.astype(np.float64)
-        denominador = self.F - self.D
-        
-        # Manejo de división por cero funcional: devolver identidad donde el denominador sea 0
-        return np.where(denominador > 0, (img_flat - self.D) / denominador, img_flat)
+        # Operación atómica pura: (I - D) * 1/(F - D), con un único array de salida
+        tipo = self._dtype_salida(img)
+        if self._desplazamiento is None:
+            return np.multiply(img, self._inv_den, dtype=tipo)
+        out = np.subtract(img, self._desplazamiento, dtype=tipo)
+        return np.multiply(out, self._inv_den, out=out)
 
 class FlatFieldEstimado:
     nombre = "flat_field_estimado"
+    # Desde este sigma el suavizado se hace en frecuencia: la convolución espacial cuesta
+    # O(N * sigma) por eje y la FFT O(N log N)
+    SIGMA_MIN_FFT = 15.0
     
-    def __init__(self, sigma: float = 100.0, mascara: tuple[int, int] = (0, 0)):
+    def __init__(self, sigma: float = 100.0, mascara: tuple[int, int] = (0, 0), backend: str = None):
         """
             En caso de no haber un campo plano de fondo y otra oscura, se puede aproximar usando una correccion gaussiana.
             Se inyecta un filtrado Gaussiano configurado específicamente para estimación de fondo.
             Un sigma alto (100) garantiza que solo se capture la curvatura de la luz, con una mascara pequeña : Evitar que tome objetos pequeños, 
             no puntuales como luz erronea o como fondo.
+            Con backend "cuda" el suavizado (siempre por FFT) y la división corren en la GPU con
+            CuPy; None usa el backend configurado con configurar_backend.
         """
         # Instanciamos el Gaussiano internamente con los parámetros de "fondo"
         self.estimador = Gaussiano(sigma=sigma, mascara=mascara)
+        self.sigma = sigma
+        # Con una máscara explícita el núcleo está truncado y se respeta la ruta espacial
+        self._usar_fft = sigma >= self.SIGMA_MIN_FFT and tuple(mascara) == (0, 0)
+        self.backend = resolver_backend(backend)
+        # Función de transferencia gaussiana (rfft2) por forma de la imagen extendida y módulo
+        self._H = {}
+
+    def _gaussiano_fft(self, img, xp=np):
+        """
+            Suavizado gaussiano por producto en frecuencia. La imagen se extiende 3 sigmas por
+            reflejo antes de la FFT, para que la convolución circular no mezcle bordes opuestos
+            (equivale al borde reflejado de la ruta espacial). xp es numpy o cupy.
+        """
+        h, w = img.shape
+        margen = int(np.ceil(3 * self.sigma))
+        my, mx = min(margen, h - 1), min(margen, w - 1)
+        extendida = xp.pad(img.astype(xp.float64), ((my, my), (mx, mx)), mode='reflect')
+
+        forma = extendida.shape
+        clave = (forma, xp.__name__)
+        H = self._H.get(clave)
+        if H is None:
+            fy = xp.fft.fftfreq(forma[0])[:, None]
+            fx = xp.fft.rfftfreq(forma[1])[None, :]
+            H = self._H[clave] = xp.exp(-2.0 * (np.pi * self.sigma) ** 2 * (fx * fx + fy * fy))
+
+        suavizada = xp.fft.irfft2(xp.fft.rfft2(extendida) * H, s=forma)
+        return suavizada[my:my + h, mx:mx + w]
 
     def __call__(self, img: np.ndarray) -> np.ndarray:
         # F_estimado captura la tendencia global de iluminación (el viñeteo)
-        F_estimado = self.estimador(img).astype(np.float64)
+        if self.backend == "cuda" and img.ndim == 2:
+            img_cp = cp.asarray(img, dtype=cp.float64)
+            F_cp = self._gaussiano_fft(img_cp, cp)
+            return cp.asnumpy(cp.where(F_cp > 0, img_cp / F_cp, img_cp))
+        if self._usar_fft and img.ndim == 2:
+            F_estimado = self._gaussiano_fft(img)
+        else:
+            F_estimado = self.estimador(img).astype(np.float64, copy=False)
         img_flat = img.astype(np.float64)
         
-        # Para la corrección multiplicativa pura I / F
-        # np.where maneja la división por cero de forma vectorial
-        return np.where(F_estimado > 0, img_flat / F_estimado, img_flat)
\ No newline at end of file
+        # Para la corrección multiplicativa pura I / F, escrita sobre img_flat
+        # where deja la imagen sin corregir donde F <= 0, sin el cociente temporal de np.where
+        return np.divide(img_flat, F_estimado, out=img_flat, where=F_estimado > 0)
+
+def _fusionar_min_max(flat_field: FlatFieldReal, _) -> FlatFieldReal:
+    # Import diferido: flat_field_norm importa este módulo
+    from .flat_field_norm import FlatFieldMinMaxNorm
+    return FlatFieldMinMaxNorm.desde(flat_field)
+
+# FlatFieldReal seguido de MinMaxNorm se reemplaza por el operador fusionado en los flujos
+# encadenados. Se registra aquí, donde se define FlatFieldReal, para que la fusión esté activa
+# siempre que un flujo pueda contenerlo
+registrar_fusion(FlatFieldReal, MinMaxNorm, _fusionar_min_max)
@@ -0,0 +1,77 @@
+'''
+    Flat field y normalizacion min-max fusionados en un solo recorrido por bloques.
+
+    I_norm = (I_corr - min(I_corr)) / (max(I_corr) - min(I_corr))
+    I_corr = [I - D] * 1 / [F - D]
+
+    Aplicar FlatFieldReal y luego MinMaxNorm escribe la imagen corregida completa y la vuelve
+    a leer dos veces (minimo, maximo) antes de reescalarla. Aqui la correccion se evalua por
+    bloques que caben en L2: una primera pasada solo reduce min/max y la segunda corrige y
+    reescala cada bloque mientras sigue en cache, sin la imagen intermedia.
+'''
+
+import numpy as np
+from .flat_field import FlatFieldReal
+
+# Tamaño objetivo de bloque de ambas pasadas
+_BLOQUE_BYTES = 256 * 1024
+
+class FlatFieldMinMaxNorm(FlatFieldReal):
+    nombre = "flat_field_min_max_norm"
+
+    """
+        Operación: MinMaxNorm((I - D) / (F - D)), con los mismos precálculos de FlatFieldReal.
+        Una imagen corregida constante se devuelve sin escalar, como en MinMaxNorm.
+    """
+
+    def _corregir(self, img: np.ndarray, inv_den: np.ndarray, desplazamiento, out: np.ndarray) -> np.ndarray:
+        if desplazamiento is None:
+            return np.multiply(img, inv_den, out=out)
+        np.subtract(img, desplazamiento, out=out)
+        return np.multiply(out, inv_den, out=out)
+
+    def __call__(self, img: np.ndarray) -> np.ndarray:
+        Y, X = img.shape[-2:]
+        tipo = self._dtype_salida(img)
+        filas = max(1, _BLOQUE_BYTES // (X * np.dtype(tipo).itemsize))
+        inv_den = np.broadcast_to(self._inv_den, (Y, X))
+        desplazamiento = (None if self._desplazamiento is None
+                          else np.broadcast_to(self._desplazamiento, (Y, X)))
+        bloques = [(idx, y) for idx in np.ndindex(img.shape[:-2]) for y in range(0, Y, filas)]
+
+        # Primera pasada: solo min/max de la imagen corregida, sobre un buffer de bloque
+        scratch = np.empty((filas, X), dtype=tipo)
+        minimo, maximo = np.inf, -np.inf
+        for idx, y in bloques:
+            fin = min(y + filas, Y)
+            bloque = self._corregir(img[idx][y:fin], inv_den[y:fin],
+                                    None if desplazamiento is None else desplazamiento[y:fin],
+                                    scratch[:fin - y])
+            minimo = min(minimo, bloque.min())
+            maximo = max(maximo, bloque.max())
+
+        rango = maximo - minimo
+        escala = tipo.type(1.0 / rango if rango > 0 else 1.0)
+        minimo = tipo.type(minimo if rango > 0 else 0.0)
+
+        # Segunda pasada: corrección y reescalado de cada bloque en su destino final
+        out = np.empty(img.shape, dtype=tipo)
+        for idx, y in bloques:
+            fin = min(y + filas, Y)
+            bloque = self._corregir(img[idx][y:fin], inv_den[y:fin],
+                                    None if desplazamiento is None else desplazamiento[y:fin],
+                                    out[idx][y:fin])
+            bloque -= minimo
+            bloque *= escala
+        return out
+
+    @classmethod
+    def desde(cls, flat_field: FlatFieldReal) -> "FlatFieldMinMaxNorm":
+        """
+            Versión fusionada de un FlatFieldReal existente, reutilizando sus precálculos.
+        """
+        fusionado = cls.__new__(cls)
+        fusionado.__dict__.update(flat_field.__dict__)
+        return fusionado
+
+# La fusión (FlatFieldReal, MinMaxNorm) se registra en flat_field.py
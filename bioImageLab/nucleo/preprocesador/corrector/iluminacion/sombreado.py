@@ -7,8 +7,9 @@
     corrige : Gradientes suaves, iluminacion desigual cuando no hay flat
 '''
 
+import cv2
 import numpy as np
-from surface_fit import SurfaceFit
+from ....modelador.ajuste.ajuste_superficie import AjusteSuperficie
 
 class Sombreado:
     nombre = "sombreado_base"
@@ -29,23 +30,39 @@ class SombreadoReal(Sombreado):
         si así se requiere externamente.
     """
 
+    # Profundidad de OpenCV para la salida de cv2.multiply según el dtype entero de entrada
+    _DEPTH_CV2 = {np.dtype(np.uint8): cv2.CV_8U, np.dtype(np.uint16): cv2.CV_16U}
+
     def __init__(self, shading_map: np.ndarray):
         self.map = shading_map
+        # Mapa en float32, convertido una sola vez: la mitad de bytes por pixel que float64
+        self.map_f32 = np.asarray(shading_map).astype(np.float32, copy=False)
 
     def __call__(self, img: np.ndarray) -> np.ndarray:
-        return (img.astype(np.float64) * self.map).astype(img.dtype)
+        depth = self._DEPTH_CV2.get(img.dtype)
+        if depth is not None and img.shape == self.map_f32.shape and img.ndim == 2:
+            # Producto con redondeo y saturación en una pasada, directo al dtype de entrada
+            return cv2.multiply(img, self.map_f32, dtype=depth)
+        if np.issubdtype(img.dtype, np.floating):
+            return np.multiply(img, self.map_f32, out=np.empty(np.broadcast_shapes(img.shape, self.map_f32.shape), dtype=img.dtype))
+        return (img * self.map_f32).astype(img.dtype)
 
 class SombreadoEstimado(Sombreado):
     nombre = "sombreado_estimado" # Ajuste polinomial.
     def __init__(self, grado: int = 2):
         self.grado = grado
+        self.estimador = AjusteSuperficie(grado=grado)
 
     def __call__(self, img: np.ndarray) -> np.ndarray:
         # Ajusta un plano curvo a la imagen para detectar el gradiente de luz
-        h, w = img.shape
-        y, x = np.mgrid[:h, :w]
-        
-        # Simplificación: Ajuste de mínimos cuadrados para estimar el plano de luz
-        # Esto genera una superficie suave que representa el "shading"
-        # (Implementación matemática del ajuste de superficie...)
-        return img # Retorna la imagen corregida aplicando el plano inverso
\ No newline at end of file
+        # Esto genera una superficie suave que representa el "shading" L
+        L = self.estimador(img)
+
+        # L se lleva a media 1 para que la corrección I / L conserve la intensidad global
+        media = L.mean()
+        if media > 0:
+            L /= media
+
+        # Retorna la imagen corregida aplicando el plano inverso (identidad donde L <= 0)
+        img_flat = img.astype(np.float64)
+        return np.divide(img_flat, L, out=img_flat, where=L > 0)
\ No newline at end of file
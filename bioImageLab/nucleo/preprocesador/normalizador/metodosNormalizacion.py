@@ -5,17 +5,181 @@ import numpy as np
 
 class MetodoNormalizacion:
     nombre = "base_norm"
+    # True si el método es afín, (img - desplazamiento) * escala con los estadísticos de
+    # _parametros: __call__ acepta ejes (normalización por cortes en una sola llamada) y tabla
+    por_ejes = False
+    # True si el resultado se recorta a [0, 1]
+    recorte = False
 
     """
         Clase base abstracta para métodos de normalización.
+        Si se pasa out (array flotante de la misma forma), el resultado se escribe allí
+        directamente y se retorna out, sin crear arrays temporales del tamaño de la imagen.
+        Si se pasa ejes, los estadísticos se calculan a lo largo de esos ejes (keepdims) y se
+        aplican por broadcasting: cada corte se normaliza con sus propios valores.
     """
     
-    def __call__(self, data: np.ndarray) -> np.ndarray:
+    def __call__(self, data: np.ndarray, out: np.ndarray = None, ejes: tuple = None) -> np.ndarray:
         raise NotImplementedError
 
+    def _parametros(self, img: np.ndarray, ejes: tuple = None) -> tuple:
+        """
+            Estadísticos de la transformación: (desplazamiento o None, escala, válidos).
+        """
+        raise NotImplementedError
+
+    def _aplicar(self, img: np.ndarray, parametros: tuple, out: np.ndarray = None) -> np.ndarray:
+        desplazamiento, escala, valido = parametros
+        out = _escalar(img, desplazamiento, escala, out)
+        if not self.recorte:
+            return out
+        # Los cortes degenerados se devuelven sin escalar ni clipear
+        if valido.all():
+            return np.clip(out, 0, 1, out=out)
+        return np.clip(out, 0, 1, out=out, where=valido)
+
+    def tabla(self, img: np.ndarray, niveles: int, parametros: tuple = None) -> np.ndarray:
+        """
+            LUT float32 de niveles entradas con la normalización global de img (entera sin signo,
+            valores < niveles) evaluada en cada valor posible: tabla[img] equivale a self(img)
+            sin cast ni aritmética por píxel. Con parametros (globales, de _parametros) no se
+            vuelve a reducir img.
+        """
+        if parametros is None:
+            parametros = self._parametros(img)
+        return self._aplicar(np.arange(niveles, dtype=np.float32), parametros)
+
+    def tabla_u16(self, img: np.ndarray, parametros: tuple = None) -> np.ndarray:
+        return self.tabla(img, 65536, parametros)
+
+    def tabla_u8(self, img: np.ndarray, parametros: tuple = None) -> np.ndarray:
+        return self.tabla(img, 256, parametros)
+
+def _inverso(rango):
+    """
+        1/rango donde rango > 0 y 1 en los cortes degenerados (imagen constante), que
+        quedan sin escalar. Retorna también la máscara de cortes válidos.
+    """
+    rango = np.asarray(rango, dtype=np.float64)
+    valido = rango > 0
+    # Un solo divide enmascarado sobre los estadísticos: los cortes inválidos conservan el 1
+    return np.divide(1.0, rango, out=np.ones_like(rango), where=valido), valido
+
+# Tamaño objetivo de bloque para las pasadas fusionadas (cabe en L2)
+_BLOQUE_BYTES = 256 * 1024
+
+def _escalar(img: np.ndarray, desplazamiento, escala, out: np.ndarray = None) -> np.ndarray:
+    """
+        out = (img - desplazamiento) * escala, en el dtype flotante de destino.
+        Con out, el cast desde enteros y el escalado ocurren en una sola pasada.
+    """
+    if out is None:
+        tipo = img.dtype.type if np.issubdtype(img.dtype, np.floating) else np.float64
+        out = np.empty(img.shape, dtype=tipo)
+    # Multiplicar por el inverso en el dtype flotante de destino (sin promover a float64)
+    escala = np.asarray(escala, dtype=out.dtype)
+    if desplazamiento is None:
+        return np.multiply(img, escala, out=out)
+
+    desplazamiento = np.asarray(desplazamiento)
+    if img.ndim < 2 or out.nbytes <= _BLOQUE_BYTES or not _constante_en_plano(desplazamiento, escala):
+        np.subtract(img, desplazamiento, out=out)
+        return np.multiply(out, escala, out=out)
+
+    # Imagen grande: resta y escala por bloques de filas de ~256 KB, para que la segunda
+    # pasada lea el bloque desde L2 en lugar de volver a recorrer la RAM
+    lideres = img.shape[:-2]
+    Y, X = img.shape[-2:]
+    filas = max(1, _BLOQUE_BYTES // (X * out.itemsize))
+    desplazamiento = np.broadcast_to(desplazamiento, lideres + (1, 1))
+    escala = np.broadcast_to(escala, lideres + (1, 1))
+    for idx in np.ndindex(lideres):
+        for y in range(0, Y, filas):
+            bloque = out[idx][y:y + filas]
+            np.subtract(img[idx][y:y + filas], desplazamiento[idx], out=bloque)
+            np.multiply(bloque, escala[idx], out=bloque)
+    return out
+
+def _media_y_desvio(img: np.ndarray, ejes: tuple = None) -> tuple:
+    """
+        Media y desviación estándar (float64) con sumas de x y x², sin el temporal (x - media)
+        del tamaño de la imagen que crea np.std ni su segunda reducción. Con acumulación en
+        float64 la cancelación de E[x²] - media² es despreciable para datos de microscopía.
+    """
+    keepdims = ejes is not None
+    n = img.size if ejes is None else int(np.prod([img.shape[e] for e in ejes]))
+    media = np.add.reduce(img, axis=ejes, dtype=np.float64, keepdims=keepdims) / n
+    # Suma de cuadrados con einsum: castea a float64 por bloques, sin materializar x²
+    indices = "abcdefghijklmnopqrstuvwxyz"[:img.ndim]
+    libres = "" if ejes is None else "".join(c for i, c in enumerate(indices) if i not in ejes)
+    cuadrados = np.einsum(f"{indices},{indices}->{libres}", img, img, dtype=np.float64)
+    if keepdims:
+        cuadrados = np.expand_dims(cuadrados, ejes)
+    varianza = np.maximum(cuadrados / n - media * media, 0.0)
+    return media, np.sqrt(varianza)
+
+# Elementos por bloque del histograma: acota el temporal intp que crea np.bincount
+_BLOQUE_HISTOGRAMA = 1 << 20
+
+def _percentiles(img: np.ndarray, percentiles) -> np.ndarray:
+    """
+        Percentiles globales de img con la interpolación lineal de np.percentile.
+        Para uint8/uint16 se leen de la suma acumulada del histograma (una pasada por bloques);
+        para el resto, de una única selección parcial np.partition (O(N)) en los dos rangos.
+    """
+    plano = img.reshape(-1)
+    n = plano.size
+    posicion = np.asarray(percentiles, dtype=np.float64) / 100.0 * (n - 1)
+    k = np.floor(posicion).astype(np.intp)
+    k1 = np.minimum(k + 1, n - 1)
+    fraccion = posicion - k
+
+    if img.dtype in (np.uint8, np.uint16):
+        niveles = 1 << (8 * img.itemsize)
+        histograma = np.zeros(niveles, dtype=np.intp)
+        for i in range(0, n, _BLOQUE_HISTOGRAMA):
+            histograma += np.bincount(plano[i:i + _BLOQUE_HISTOGRAMA], minlength=niveles)
+        acumulado = np.cumsum(histograma)
+        # El k-ésimo valor ordenado es el menor nivel con más de k elementos acumulados
+        v = np.searchsorted(acumulado, k, side='right').astype(np.float64)
+        v1 = np.searchsorted(acumulado, k1, side='right').astype(np.float64)
+    else:
+        particion = np.partition(plano, np.unique(np.concatenate([k, k1])))
+        v = particion[k].astype(np.float64)
+        v1 = particion[k1].astype(np.float64)
+    return v + (v1 - v) * fraccion
+
+def _extremo(ufunc, img: np.ndarray, ejes: tuple = None) -> np.ndarray:
+    """
+        ufunc.reduce (np.maximum o np.minimum) sobre ejes, con keepdims si ejes no es None.
+        Si ejes incluye los dos ejes espaciales y el layout lo permite sin copia, (Y, X) se
+        colapsa en un solo eje contiguo: el bucle SIMD de la reducción recorre tramos de Y*X
+        elementos en lugar de filas de X.
+    """
+    if ejes is None:
+        return ufunc.reduce(img, axis=None)
+    espaciales = (img.ndim - 2, img.ndim - 1)
+    if img.ndim >= 2 and all(e in ejes for e in espaciales):
+        vista = img.view()
+        try:
+            vista.shape = img.shape[:-2] + (-1,)
+        except (AttributeError, ValueError):
+            return ufunc.reduce(img, axis=ejes, keepdims=True)
+        lideres = tuple(e for e in ejes if e not in espaciales)
+        return ufunc.reduce(vista, axis=lideres + (img.ndim - 2,), keepdims=True)[..., np.newaxis]
+    return ufunc.reduce(img, axis=ejes, keepdims=True)
+
+def _constante_en_plano(*parametros) -> bool:
+    """
+        True si los parámetros no varían dentro de un plano (Y, X): escalares o con keepdims
+        sobre los dos últimos ejes, de modo que se pueden aplicar bloque a bloque.
+    """
+    return all(p.ndim == 0 or p.shape[-2:] == (1, 1) for p in parametros)
+
 # Normalizar solo por el pixel maximo.
 class MaxNorm(MetodoNormalizacion):
     nombre = "max_norm"
+    por_ejes = True
 
     """
         Normaliza dividiendo por el valor máximo.
@@ -26,12 +190,18 @@ class MaxNorm(MetodoNormalizacion):
         Retorna:
             Array normalizado a [0, 1]
     """
-    def __call__(self, img: np.ndarray) -> np.ndarray:
-        return img / img.max() if img.max() > 0 else img.astype(np.float64)
+    def _parametros(self, img: np.ndarray, ejes: tuple = None) -> tuple:
+        maximo = _extremo(np.maximum, img, ejes)
+        escala, valido = _inverso(maximo)
+        return None, escala, valido
+
+    def __call__(self, img: np.ndarray, out: np.ndarray = None, ejes: tuple = None) -> np.ndarray:
+        return self._aplicar(img, self._parametros(img, ejes), out)
 
 # Normalizar por pixel maximo y minimo.abs
 class MinMaxNorm(MetodoNormalizacion):
     nombre = "min_max_norm"
+    por_ejes = True
 
     """
         Normaliza al rango [0, 1] usando min-max scaling.
@@ -43,34 +213,53 @@ class MinMaxNorm(MetodoNormalizacion):
             Array normalizado a [0, 1]
     """
 
-    def __call__(self, img: np.ndarray) -> np.ndarray:
-        return (img - img.min()) / (img.max() - img.min()) if img.max() != img.min() else img.astype(np.float64)
+    def _parametros(self, img: np.ndarray, ejes: tuple = None) -> tuple:
+        minimo = _extremo(np.minimum, img, ejes)
+        maximo = _extremo(np.maximum, img, ejes)
+        escala, valido = _inverso(maximo - minimo)
+        return np.where(valido, minimo, 0), escala, valido
+
+    def __call__(self, img: np.ndarray, out: np.ndarray = None, ejes: tuple = None) -> np.ndarray:
+        return self._aplicar(img, self._parametros(img, ejes), out)
 
 # Normalizar por percentil:
 class PercentilNorm(MetodoNormalizacion):
     nombre = "percentil_norm"
+    por_ejes = True
+    recorte = True
+
     def __init__(self, p_bajo: int = 2, p_alto: int = 98):
         self.p_bajo, self.p_alto = p_bajo, p_alto
     
-    def __call__(self, img: np.ndarray) -> np.ndarray:
+    def _parametros(self, img: np.ndarray, ejes: tuple = None) -> tuple:
+        if ejes is None:
+            # Global: histograma (enteros de 8/16 bits) o selección parcial, sin copia ordenada
+            bajo, alto = _percentiles(img, (self.p_bajo, self.p_alto))
+        else:
+            bajo, alto = np.percentile(img, [self.p_bajo, self.p_alto], axis=ejes, keepdims=True)
+        escala, valido = _inverso(alto - bajo)
+        return np.where(valido, bajo, 0), escala, valido
+
+    def __call__(self, img: np.ndarray, out: np.ndarray = None, ejes: tuple = None) -> np.ndarray:
 
         """
             Normaliza usando percentiles y clipea a [0, 1].
             
             Argumento:
                 img: Array de cualquier forma
+                out: Array destino opcional
+                ejes: Ejes de reducción para normalizar por cortes (opcional)
                 
             Retorna:
                 Array normalizado y clipeado a [0, 1]
         """
 
-        # Variable local por pura eficiencia de CPU (O(N log N))
-        limites = np.percentile(img, [self.p_bajo, self.p_alto])
-        return np.clip((img - limites[0]) / (limites[1] - limites[0]), 0, 1) if limites[1] > limites[0] else img.astype(np.float64)
+        return self._aplicar(img, self._parametros(img, ejes), out)
 
 # Normalizar por ZScore
 class ZScoreNorm(MetodoNormalizacion):
     nombre = "zscore_norm"
+    por_ejes = True
 
     """
         Normaliza restando media y dividiendo por desviación estándar.
@@ -83,5 +272,10 @@ class ZScoreNorm(MetodoNormalizacion):
             Array estandarizado (media=0, sigma=1)
     """
     
-    def __call__(self, img: np.ndarray) -> np.ndarray:
-        return (img - img.mean()) / img.std() if img.std() > 0 else img.astype(np.float64)
\ No newline at end of file
+    def _parametros(self, img: np.ndarray, ejes: tuple = None) -> tuple:
+        media, desvio = _media_y_desvio(img, ejes)
+        escala, valido = _inverso(desvio)
+        return np.where(valido, media, 0), escala, valido
+
+    def __call__(self, img: np.ndarray, out: np.ndarray = None, ejes: tuple = None) -> np.ndarray:
+        return self._aplicar(img, self._parametros(img, ejes), out)
\ No newline at end of file
@@ -1,4 +1,7 @@
+import logging
+import weakref
 import numpy as np
+import cv2
 from metodosNormalizacion import (
     MetodoNormalizacion, 
     MaxNorm, 
@@ -9,6 +12,29 @@ from metodosNormalizacion import (
 from dataclasses import dataclass
 from typing import Union, List, Optional
 
+try:
+    from ...._warmup import registrar as registrar_warmup
+except ImportError:  # Importado como módulo suelto (con su carpeta en sys.path): sin precompilación
+    def registrar_warmup(funcion, al_importar=True):
+        pass
+
+log = logging.getLogger(__name__)
+
+try:
+    from numba import njit, prange
+except ImportError:  # Numba es opcional: sin él se usan las reducciones por ejes de NumPy
+    njit = None
+
+try:
+    import cupy as cp
+except ImportError:  # CuPy es opcional: sin él solo está disponible el backend "cpu"
+    cp = None
+
+# Backends de cómputo: "auto" usa la GPU solo si CuPy está disponible y el volumen es grande
+_BACKENDS = {"cpu", "cuda", "auto"}
+# Con backend "auto", tamaño mínimo de img_5d para amortizar la transferencia por PCIe
+_MIN_BYTES_GPU = 256 * 1024 * 1024
+
 # Tipos inmutables para manejar formas de normalización
 
 @dataclass(frozen=True) 
@@ -35,14 +61,178 @@ class T_Norm_PorCorte:
 
 TipoNormalizacion = Union[Norm_Global, Z_Norm_PorCorte, T_Norm_PorCorte]
 
+# Ejes de reducción de cada tipo sobre un canal [T, Z, Y, X] (None: global)
+_EJES_TIPO = {Norm_Global: None, Z_Norm_PorCorte: (0, 2, 3), T_Norm_PorCorte: (1, 2, 3)}
+
+# Métodos con equivalente directo en cv2.normalize (ruta SIMD de OpenCV para imágenes 2D).
+# Se compara el tipo exacto: una subclase puede redefinir __call__.
+_NORMAS_CV2 = {MaxNorm: cv2.NORM_INF, MinMaxNorm: cv2.NORM_MINMAX}
+_DTYPES_CV2 = (np.uint8, np.uint16, np.int16, np.float32, np.float64)
+
+def _normalizar_2d_cv2(metodo: MetodoNormalizacion, src: np.ndarray, dst: np.ndarray) -> bool:
+    """
+        Normaliza un plano (Y, X) con cv2.normalize escribiendo en dst (float32).
+        Retorna False si el método o el dtype no tienen ruta en OpenCV, o si la imagen es
+        degenerada, para que el llamador use la ruta NumPy con la semántica de cada método.
+    """
+    norma = _NORMAS_CV2.get(type(metodo))
+    if norma is None or src.dtype.type not in _DTYPES_CV2 or dst.dtype != np.float32:
+        return False
+
+    minimo, maximo, _, _ = cv2.minMaxLoc(src)
+    # NORM_INF escala por max|x|, que solo coincide con MaxNorm si no hay negativos
+    if maximo <= 0 or maximo == minimo or (norma == cv2.NORM_INF and minimo < 0):
+        return False
+
+    # NORM_MINMAX lleva el rango a [alpha, beta]; el resto de las normas escala por
+    # alpha / ||src|| (beta se ignora), así que NORM_INF necesita alpha = 1
+    alpha = 0 if norma == cv2.NORM_MINMAX else 1
+    res = cv2.normalize(src, dst, alpha=alpha, beta=1, norm_type=norma, dtype=cv2.CV_32F)
+    if res is not dst:
+        dst[...] = res
+    return True
+
+def _normalizar_planos_cv2(metodo: MetodoNormalizacion, src: np.ndarray, dst: np.ndarray) -> bool:
+    """
+        Normaliza cada plano (Y, X) de src (N, Y, X) en dst con cv2.normalize. Retorna False sin
+        tocar dst si el método no tiene equivalente en OpenCV; los planos que OpenCV no resuelve
+        (degenerados, dtype sin ruta) se normalizan con el propio método.
+    """
+    if type(metodo) not in _NORMAS_CV2:
+        return False
+    for i in range(src.shape[0]):
+        if not _normalizar_2d_cv2(metodo, src[i], dst[i]):
+            metodo(src[i], out=dst[i])
+    return True
+
+def _planos(a: np.ndarray) -> np.ndarray:
+    """
+        Vista (N, Y*X) de un array (..., Y, X) sin copiar: colapsa los ejes para que las
+        reducciones recorran tramos contiguos largos (bucle SIMD de NumPy) en lugar de la
+        iteración genérica por ejes. Si el layout no lo permite sin copia, retorna a tal cual.
+    """
+    vista = a.view()
+    try:
+        vista.shape = (-1, a.shape[-2] * a.shape[-1])
+    except (AttributeError, ValueError):
+        return a
+    return vista
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True, boundscheck=False)
+    def _maxnorm_cortes(src, dst):
+        """
+            MaxNorm por corte: dst[i] = src[i] / max(src[i]) para cada i del primer eje, en
+            paralelo. Cada corte se reduce y escala mientras sigue caliente en caché.
+            src y dst son 4D (S, A, Y, X); los cortes con máximo <= 0 se copian sin escalar.
+        """
+        S, A, Y, X = src.shape
+        for i in prange(S):
+            m = src[i, 0, 0, 0]
+            for a in range(A):
+                for y in range(Y):
+                    for x in range(X):
+                        v = src[i, a, y, x]
+                        if v > m:
+                            m = v
+            inv = np.float32(1.0 / m) if m > 0 else np.float32(1.0)
+            for a in range(A):
+                for y in range(Y):
+                    for x in range(X):
+                        dst[i, a, y, x] = src[i, a, y, x] * inv
+
+    @njit(parallel=True, fastmath=True, cache=True, boundscheck=False)
+    def _minmaxnorm_cortes(src, dst):
+        """
+            MinMaxNorm por corte: mínimo y máximo en una sola pasada de reducción (NumPy necesita
+            dos) y escalado dst[i] = (src[i] - min) / (max - min), en paralelo sobre el primer
+            eje. Los cortes constantes se copian sin escalar, como en MinMaxNorm.
+        """
+        S, A, Y, X = src.shape
+        for i in prange(S):
+            mn = src[i, 0, 0, 0]
+            mx = mn
+            for a in range(A):
+                for y in range(Y):
+                    for x in range(X):
+                        v = src[i, a, y, x]
+                        if v < mn:
+                            mn = v
+                        elif v > mx:
+                            mx = v
+            if mx > mn:
+                desplazamiento = np.float32(mn)
+                inv = np.float32(1.0 / (np.float64(mx) - np.float64(mn)))
+            else:
+                desplazamiento = np.float32(0.0)
+                inv = np.float32(1.0)
+            for a in range(A):
+                for y in range(Y):
+                    for x in range(X):
+                        dst[i, a, y, x] = (src[i, a, y, x] - desplazamiento) * inv
+
+    # Núcleos por corte de los métodos con ruta compilada (tipo exacto, como en _NORMAS_CV2)
+    _KERNELS_CORTES = {MaxNorm: _maxnorm_cortes, MinMaxNorm: _minmaxnorm_cortes}
+
+    def _precompilar():
+        # Mismos layouts de Normalizador: canal no contiguo de un 5D uint16 hacia float32,
+        # en orden T y transpuesto en Z
+        src = np.zeros((2, 2, 2, 4, 4), dtype=np.uint16)[:, :, 0]
+        dst = np.empty((2, 2, 4, 4), dtype=np.float32)
+        for kernel in _KERNELS_CORTES.values():
+            kernel(src, dst)
+            kernel(src.transpose(1, 0, 2, 3), dst.transpose(1, 0, 2, 3))
+
+    registrar_warmup(_precompilar)
+
+def _estadisticos_gpu(metodo: MetodoNormalizacion, x, ejes: Optional[tuple]) -> Optional[tuple]:
+    """
+        (desplazamiento o None, rango) en GPU de los métodos afines con keepdims sobre ejes
+        (None: global): la transformación es (x - desplazamiento) / rango. Retorna None si el
+        método no tiene ruta en GPU (se compara el tipo exacto, como en _NORMAS_CV2).
+    """
+    tipo = type(metodo)
+    if tipo is MaxNorm:
+        return None, x.max(axis=ejes, keepdims=True)
+    if tipo is MinMaxNorm:
+        minimo = x.min(axis=ejes, keepdims=True)
+        return minimo, x.max(axis=ejes, keepdims=True) - minimo
+    if tipo is PercentilNorm:
+        bajo, alto = cp.percentile(x, [metodo.p_bajo, metodo.p_alto], axis=ejes, keepdims=True)
+        return bajo, alto - bajo
+    if tipo is ZScoreNorm:
+        return x.mean(axis=ejes, keepdims=True), x.std(axis=ejes, keepdims=True)
+    return None
+
 class Normalizador:
     """
         Clase para gestionar los diferentes tipos de normalización en imágenes confocales y aplicar 
         diferentes métodos de normalización.
         
         Nota: 
-            - img_normalizada[i] corresponde al canal i original, con forma (T, Z, 1, Y, X). 
-            - Los canales no procesados permanecen como None.
+            - Por defecto cada llamada reserva y retorna su propia salida float32 del canal, sin
+            retenerla: el normalizador no acumula memoria entre canales.
+            - Con keep_cache=True, img_normalizada es un único tensor float32 (C, T, Z, Y, X), en
+            orden canal-mayor para que cada canal sea un bloque contiguo; img_normalizada[i] es el
+            canal i (T, Z, Y, X). _norm_valid[i] indica si el canal i ya fue normalizado; los demás
+            tienen contenido indefinido (se usa canal_normalizado para obtener None en ese caso).
+            - Con umbral, cada llamada deja además en img_binaria[canal] la máscara uint8 (0/1)
+            [T, Z, 1, Y, X] de los píxeles normalizados mayores al umbral. Con empaquetar=True la
+            máscara se guarda con un bit por píxel (np.packbits sobre X, bitorder='little'), de
+            forma [T, Z, 1, Y, ceil(X / 8)]; np.unpackbits(..., count=X, bitorder='little')
+            recupera un corte.
+            - Con backend "cuda" (o "auto" y un volumen de al menos _MIN_BYTES_GPU), los métodos
+            afines normalizan y binarizan el canal en la GPU con CuPy: el canal se transfiere una
+            vez y la salida y la máscara quedan en la GPU (cupy.ndarray; .get() las trae a NumPy).
+            Con keep_cache la salida se copia además al tensor img_normalizada en memoria.
+            - Con tile_t y/o tile_z (métodos por_ejes), tras calcular los estadísticos el canal
+            se normaliza y binariza por bloques de tile_t fotogramas x tile_z cortes: cada bloque
+            se umbraliza mientras sigue en caché, en lugar de releer el tensor completo.
+            - Los estadísticos de los métodos por_ejes (máximos, mínimos, percentiles...) se
+            guardan por (canal, ejes, método) mientras llegue el mismo array img_5d: volver a
+            normalizar un canal (otro umbral, o tras cambiar tipo y regresar) solo aplica la
+            transformación, sin recorrer el canal para reducirlo. Si img_5d se modifica en el
+            lugar hay que llamar a reset().
         
         Ejemplo de uso:
             >>> norm = Normalizador(tipo=Norm_Global(), metodo=MaxNorm())
@@ -53,16 +243,80 @@ class Normalizador:
     def __init__(
         self, 
         tipo: TipoNormalizacion = Norm_Global(),
-        metodo: MetodoNormalizacion = MaxNorm()
+        metodo: MetodoNormalizacion = MaxNorm(),
+        keep_cache: bool = False,
+        umbral: Optional[float] = None,
+        tile_t: Optional[int] = None,
+        tile_z: Optional[int] = None,
+        empaquetar: bool = False,
+        backend: str = "cpu"
     ):
         """
             Args:
                 tipo: Estrategia de normalización (Global, por Z, por T)
                 metodo: Algoritmo de normalización (MaxNorm, MinMaxNorm, etc.)
+                keep_cache: Si True, los canales normalizados se conservan en img_normalizada
+                umbral: Si no es None, se binariza cada canal normalizado contra este valor
+                tile_t: Fotogramas por bloque en la aplicación por bloques (None: todos)
+                tile_z: Cortes Z por bloque en la aplicación por bloques (None: todos)
+                empaquetar: Si True, img_binaria guarda un bit por píxel (8 veces menos memoria)
+                backend: "cpu", "cuda" (CuPy) o "auto" (GPU solo para volúmenes grandes)
         """
+        if backend not in _BACKENDS:
+            raise ValueError(f"Backend desconocido: {backend}. Opciones: {sorted(_BACKENDS)}")
+        if backend == "cuda" and cp is None:
+            raise ImportError("El backend 'cuda' requiere el paquete cupy")
+        for nombre, tile in (("tile_t", tile_t), ("tile_z", tile_z)):
+            if tile is not None and tile < 1:
+                raise ValueError(f"{nombre} debe ser >= 1, es {tile}")
         self.tipo = tipo
         self.metodo = metodo 
-        self.img_normalizada: Optional[List[Optional[np.ndarray]]] = None
+        self.keep_cache = keep_cache
+        self.umbral = umbral
+        self.tile_t = tile_t
+        self.tile_z = tile_z
+        self.empaquetar = empaquetar
+        self.backend = backend
+        # Máscaras uint8 (0/1) [T, Z, 1, Y, X] por canal (empaquetadas: [T, Z, 1, Y, ceil(X/8)]),
+        # o None si el canal no se binarizó
+        self.img_binaria: List[Optional[np.ndarray]] = []
+        # Se incrementa en cada escritura de una máscara: los buffers se reutilizan en el lugar,
+        # así que los visores (plot_bioImagen_jn) lo usan para saber que el contenido cambió
+        self.version_binaria = 0
+        self.img_normalizada: Optional[np.ndarray] = None
+        self._norm_valid: Optional[np.ndarray] = None
+        # Estadísticos por (canal, ejes, método) de la imagen referida por _img_ref
+        self._estadisticos: dict[tuple, tuple] = {}
+        self._img_ref: Optional[weakref.ref] = None
+
+    @property
+    def tipo(self) -> TipoNormalizacion:
+        return self._tipo
+
+    @tipo.setter
+    def tipo(self, tipo: TipoNormalizacion):
+        """
+            Resuelve una sola vez la estrategia del tipo (función de _NORMALIZADORES) y sus ejes
+            de reducción, en lugar de despachar con match en cada llamada.
+        """
+        if type(tipo) not in self._NORMALIZADORES:
+            raise TypeError(f"Tipo de normalización desconocido: {type(tipo).__name__}")
+        self._tipo = tipo
+        self._estrategia = self._NORMALIZADORES[type(tipo)]
+        self._ejes = _EJES_TIPO[type(tipo)]
+
+    @property
+    def metodo(self) -> MetodoNormalizacion:
+        return self._metodo
+
+    @metodo.setter
+    def metodo(self, metodo: MetodoNormalizacion):
+        self._metodo = metodo
+        # Los métodos con por_ejes normalizan todos los cortes en una sola llamada, con
+        # reducciones sobre los ejes espaciales de canal_src [T, Z, Y, X] y broadcasting
+        self._vectorizado = getattr(metodo, "por_ejes", False)
+        # MaxNorm y MinMaxNorm por cortes tienen además un kernel Numba paralelo
+        self._kernel = _KERNELS_CORTES.get(type(metodo)) if njit is not None else None
 
     def __call__(
         self,
@@ -82,7 +336,8 @@ class Normalizador:
                 t_ref: Timelapse de referencia (no usado en esta versión) (default: 0)
 
             Retorno:
-                Array 5D normalizado [T, Z, 1, Y, X] del canal
+                Array 5D normalizado [T, Z, 1, Y, X] del canal (float32; con keep_cache, vista
+                sobre img_normalizada)
 
             Complejidad:
                 O(T*Z*Y*X) en el peor caso
@@ -99,48 +354,291 @@ class Normalizador:
         if not (0 <= z_ref < Z):
             raise IndexError(f"z_ref={z_ref} fuera de rango. Z max: {Z-1}")
 
+        # Una imagen nueva invalida los estadísticos guardados
+        if self._img_ref is None or self._img_ref() is not img_5d:
+            self._estadisticos.clear()
+            self._img_ref = weakref.ref(img_5d)
+
         try:
-            # Convertir a float para evitar pérdida de precisión
-            img_float = img_5d.astype(np.float64)
-
-            # Inicializar lista de canales normalizados si no existe
-            if self.img_normalizada is None:
-                self.img_normalizada = [None for _ in range(C)]
-
-            # Inicializar el canal específico si no existe
-            if self.img_normalizada[canal] is None:
-                self.img_normalizada[canal] = np.zeros((T, Z, 1, Y, X), dtype=np.float64)
-
-            match self.tipo:
-                case Norm_Global():
-                    # Extraer datos del canal a normalizar
-                    canal_data = img_float[:, :, canal, :, :]
-                    # Aplicar método de normalización
-                    self.img_normalizada[canal][:, :, 0, :, :] = self.metodo(canal_data)
-                    print(f"Canal {canal} normalizado globalmente con {self.metodo.nombre}")
-
-                case Z_Norm_PorCorte():
-                    # Normalizar cada corte Z independientemente
-                    for z in range(Z):
-                        canal_data = img_float[:, z, canal, :, :]
-                        self.img_normalizada[canal][:, z, 0, :, :] = self.metodo(canal_data)
-                    print(f"Canal {canal}: {Z} cortes Z normalizados con {self.metodo.nombre}")
-
-                case T_Norm_PorCorte():
-                    # Normalizar cada fotograma independientemente
-                    for t in range(T):
-                        canal_data = img_float[t, :, canal, :, :]
-                        self.img_normalizada[canal][t, :, 0, :, :] = self.metodo(canal_data)
-                    print(f"Canal {canal}: {T} fotogramas normalizados con {self.metodo.nombre}")
-
-            return self.img_normalizada[canal]
+            if self._usar_gpu(img_5d):
+                return self._normalizar_gpu(img_5d[:, :, canal, :, :], canal, C)
+
+            # Extraer el canal sin convertirlo: cada método escribe directamente en el destino
+            # float32 (para datos uint16 llevados a [0, 1] la precisión sobra), fusionando
+            # cast y escalado sin arrays temporales del tamaño del canal
+            canal_src = img_5d[:, :, canal, :, :]
+
+            if self.keep_cache:
+                # Reservar una sola vez el tensor de todos los canales (sin escribir ceros); si
+                # llega una imagen de otra forma se descarta lo anterior
+                if self.img_normalizada is None or self.img_normalizada.shape != (C, T, Z, Y, X):
+                    self.img_normalizada = np.empty((C, T, Z, Y, X), dtype=np.float32)
+                    self._norm_valid = np.zeros(C, dtype=bool)
+                dst = self.img_normalizada[canal]
+                self._norm_valid[canal] = False
+            else:
+                # Salida transitoria del canal: la retiene solo quien la recibe
+                dst = np.empty((T, Z, Y, X), dtype=np.float32)
+            # Con estadísticos ya calculados solo queda aplicar: se omiten las rutas que reducen
+            en_cache = self._vectorizado and self._clave(canal, self._ejes) in self._estadisticos
+            # Imagen 2D (p. ej. ImagenEstandar, (1, 1, 1, Y, X)): los tres tipos coinciden en un
+            # único corte, así que el plano se normaliza directamente, sin estrategia ni bloques
+            plano = T == 1 and Z == 1 and not en_cache
+            por_tiles = not plano and self._vectorizado and (self.tile_t is not None or self.tile_z is not None)
+
+            if plano:
+                # cv2.normalize (o el propio método si OpenCV no tiene ruta) sobre el plano
+                if not _normalizar_2d_cv2(self.metodo, canal_src[0, 0], dst[0, 0]):
+                    self.metodo(canal_src[0, 0], out=dst[0, 0])
+                log.info("Canal %d (2D) normalizado con %s", canal, self.metodo.nombre)
+            elif por_tiles or en_cache:
+                self._normalizar_por_tiles(canal_src, dst, self._parametros(canal_src, canal, self._ejes), canal, C)
+                log.info("Canal %d normalizado por bloques (%s x %s) con %s%s",
+                         canal, self.tile_t, self.tile_z, self.metodo.nombre,
+                         " (estadísticos en caché)" if en_cache else "")
+            else:
+                # Estrategia resuelta al asignar tipo: sin despacho por tipo en cada llamada
+                self._estrategia(self, canal_src, dst, canal)
+
+            if self.umbral is not None and not (por_tiles or en_cache):
+                self._binarizar(dst, canal, C)
+            if self.keep_cache:
+                self._norm_valid[canal] = True
+            return dst[:, :, np.newaxis]
 
         except Exception as e:
-            print(f"Error al normalizar la imagen: {e}")
-            import traceback
-            traceback.print_exc()
+            # log.exception adjunta el traceback
+            log.exception("Error al normalizar la imagen: %s", e)
+            return None
+
+    def clave_cache(self) -> tuple:
+        """
+            Parámetros que determinan el resultado, para CacheLRU: tipo y metodo viven en
+            atributos privados (_tipo, _metodo) detrás de sus propiedades.
+        """
+        return (self.tipo, type(self.metodo), tuple(sorted(vars(self.metodo).items())),
+                self.umbral, self.tile_t, self.tile_z, self.empaquetar, self.backend)
+
+    def _usar_gpu(self, img_5d: np.ndarray) -> bool:
+        """
+            True si el canal se procesa en la GPU: backend "cuda", o "auto" con CuPy, un
+            dispositivo disponible y un volumen grande; y un método con ruta en GPU.
+        """
+        if self.backend == "cpu" or type(self.metodo) not in (MaxNorm, MinMaxNorm, PercentilNorm, ZScoreNorm):
+            return False
+        if self.backend == "cuda":
+            return True
+        return cp is not None and img_5d.nbytes >= _MIN_BYTES_GPU and cp.cuda.is_available()
+
+    def _normalizar_gpu(self, canal_src: np.ndarray, canal: int, C: int):
+        """
+            Normaliza (y con umbral binariza) el canal [T, Z, Y, X] en la GPU: una transferencia
+            del canal en su dtype nativo (más chico que float32), cast, reducciones de CuPy,
+            escalado y umbral en memoria del dispositivo. Retorna el cupy.ndarray [T, Z, 1, Y, X].
+        """
+        T, Z, Y, X = canal_src.shape
+        x = cp.asarray(canal_src).astype(cp.float32)
+        desplazamiento, rango = _estadisticos_gpu(self.metodo, x, self._ejes)
+
+        # Los cortes degenerados (rango 0) quedan sin escalar ni clipear, como en la ruta CPU
+        valido = rango > 0
+        escala = cp.where(valido, 1.0 / cp.where(valido, rango, 1), 1).astype(cp.float32)
+        if desplazamiento is not None:
+            x -= cp.where(valido, desplazamiento, 0).astype(cp.float32)
+        x *= escala
+        if self.metodo.recorte:
+            x = cp.where(valido, cp.clip(x, 0, 1), x)
+
+        if self.umbral is not None:
+            mascara = x > self.umbral
+            if self.empaquetar:
+                # El empaquetado por X se hace en memoria, con el mismo layout que la ruta CPU
+                self._buffer_binario((T, Z, Y, X), canal, C)[:, :, 0] = np.packbits(
+                    mascara.get(), axis=-1, bitorder='little')
+            else:
+                if len(self.img_binaria) != C:
+                    self.img_binaria = [None] * C
+                self.img_binaria[canal] = mascara.view(cp.uint8)[:, :, cp.newaxis]
+                self.version_binaria += 1
+        if self.keep_cache:
+            if self.img_normalizada is None or self.img_normalizada.shape != (C, T, Z, Y, X):
+                self.img_normalizada = np.empty((C, T, Z, Y, X), dtype=np.float32)
+                self._norm_valid = np.zeros(C, dtype=bool)
+            x.get(out=self.img_normalizada[canal])
+            self._norm_valid[canal] = True
+        log.info("Canal %d normalizado en GPU con %s", canal, self.metodo.nombre)
+        return x[:, :, cp.newaxis]
+
+    def _norm_global(self, canal_src: np.ndarray, dst: np.ndarray, canal: int):
+        """
+            Normaliza todo el canal [T, Z, Y, X] con un único juego de estadísticos.
+            Las imágenes 2D (T = Z = 1) no llegan aquí: las resuelve la ruta directa de __call__.
+        """
+        T, Z = canal_src.shape[:2]
+        if canal_src.dtype == np.uint16 and self._vectorizado:
+            # Un único divisor para todo el canal: tabla de 65536 valores (256 KB, cabe
+            # en L2) y un gather, en lugar de convertir y escalar cada píxel
+            tabla = self.metodo.tabla_u16(_planos(canal_src), self._parametros(canal_src, canal, self._ejes))
+            np.take(tabla, canal_src, out=dst, mode='clip')
+        elif canal_src.dtype == np.uint8 and self._vectorizado:
+            # 8 bits: tabla de 256 valores (1 KB) aplicada plano a plano con cv2.LUT,
+            # que escribe float32 directamente en el destino
+            tabla = self.metodo.tabla_u8(_planos(canal_src), self._parametros(canal_src, canal, self._ejes))
+            for t in range(T):
+                for z in range(Z):
+                    cv2.LUT(canal_src[t, z], tabla, dst=dst[t, z])
+        elif self._vectorizado:
+            # El método global es indiferente a la forma: se le pasan los planos colapsados
+            self.metodo._aplicar(_planos(canal_src), self._parametros(canal_src, canal, self._ejes), out=_planos(dst))
+        else:
+            self.metodo(_planos(canal_src), out=_planos(dst))
+        log.info("Canal %d normalizado globalmente con %s", canal, self.metodo.nombre)
+
+    def _norm_por_z(self, canal_src: np.ndarray, dst: np.ndarray, canal: int):
+        """
+            Normaliza cada corte Z independientemente.
+        """
+        T, Z = canal_src.shape[:2]
+        if self._kernel is not None:
+            # Z como primer eje: vistas transpuestas, sin copiar
+            self._kernel(canal_src.transpose(1, 0, 2, 3), dst.transpose(1, 0, 2, 3))
+        elif T == 1 and _normalizar_planos_cv2(self.metodo, canal_src[0], dst[0]):
+            # Con T = 1 cada corte Z es un único plano: ruta SIMD de OpenCV
+            pass
+        elif self._vectorizado:
+            self.metodo._aplicar(canal_src, self._parametros(canal_src, canal, self._ejes), out=dst)
+        else:
+            for z in range(Z):
+                self.metodo(canal_src[:, z], out=dst[:, z])
+        log.info("Canal %d: %d cortes Z normalizados con %s", canal, Z, self.metodo.nombre)
+
+    def _norm_por_t(self, canal_src: np.ndarray, dst: np.ndarray, canal: int):
+        """
+            Normaliza cada fotograma independientemente.
+        """
+        T, Z = canal_src.shape[:2]
+        if self._kernel is not None:
+            self._kernel(canal_src, dst)
+        elif Z == 1 and _normalizar_planos_cv2(self.metodo, canal_src[:, 0], dst[:, 0]):
+            # Con Z = 1 cada fotograma es un único plano: ruta SIMD de OpenCV
+            pass
+        elif self._vectorizado:
+            self.metodo._aplicar(canal_src, self._parametros(canal_src, canal, self._ejes), out=dst)
+        else:
+            for t in range(T):
+                self.metodo(canal_src[t], out=dst[t])
+        log.info("Canal %d: %d fotogramas normalizados con %s", canal, T, self.metodo.nombre)
+
+    # Estrategia de cada tipo de normalización
+    _NORMALIZADORES = {
+        Norm_Global: _norm_global,
+        Z_Norm_PorCorte: _norm_por_z,
+        T_Norm_PorCorte: _norm_por_t,
+    }
+
+    def _clave(self, canal: int, ejes: Optional[tuple]) -> tuple:
+        """
+            Clave de los estadísticos: el método entra con su tipo y su configuración
+            (p. ej. los percentiles de PercentilNorm), no por identidad.
+        """
+        return (canal, ejes, type(self.metodo), tuple(sorted(vars(self.metodo).items())))
+
+    def _parametros(self, canal_src: np.ndarray, canal: int, ejes: Optional[tuple]) -> tuple:
+        """
+            Estadísticos del método sobre canal_src [T, Z, Y, X] (globales o por cortes según
+            ejes), tomados de la caché si ya se calcularon para esta imagen.
+        """
+        clave = self._clave(canal, ejes)
+        parametros = self._estadisticos.get(clave)
+        if parametros is None:
+            if ejes is None:
+                # Global: parámetros escalares, calculados sobre los planos colapsados
+                parametros = self.metodo._parametros(_planos(canal_src))
+            else:
+                parametros = self.metodo._parametros(canal_src, ejes)
+                if log.isEnabledFor(logging.DEBUG):
+                    # Un único resumen por canal; sin DEBUG no se evalúa nada
+                    valido = parametros[2]
+                    log.debug("Canal %d: %d de %d cortes degenerados (sin escalar)",
+                              canal, int(valido.size - np.count_nonzero(valido)), valido.size)
+            self._estadisticos[clave] = parametros
+        return parametros
+
+    def _normalizar_por_tiles(self, canal_src: np.ndarray, dst: np.ndarray, parametros: tuple, canal: int, C: int):
+        """
+            Aplica la transformación con parametros (ya reducidos sobre el canal completo) por
+            bloques (tile_t, tile_z, Y, X) en dst y, con umbral, binariza cada bloque
+            inmediatamente, mientras sigue en caché. Sin tile_t ni tile_z es un único bloque.
+        """
+        T, Z = canal_src.shape[:2]
+        tile_t = self.tile_t or T
+        tile_z = self.tile_z or Z
+        # Parámetros por corte (keepdims) llevados a (T, Z, 1, 1) para recortarlos por bloque
+        parametros = tuple(p if p is None or np.ndim(p) == 0 else np.broadcast_to(p, (T, Z, 1, 1))
+                           for p in parametros)
+        mascara = None if self.umbral is None else self._buffer_binario(dst.shape, canal, C)[:, :, 0]
+
+        for t in range(0, T, tile_t):
+            for z in range(0, Z, tile_z):
+                bloque = (slice(t, t + tile_t), slice(z, z + tile_z))
+                parametros_bloque = tuple(p if p is None or np.ndim(p) == 0 else p[bloque] for p in parametros)
+                normalizado = self.metodo._aplicar(canal_src[bloque], parametros_bloque, out=dst[bloque])
+                if mascara is not None:
+                    self._umbralizar(normalizado, mascara[bloque])
+
+    def _buffer_binario(self, forma: tuple, canal: int, C: int) -> np.ndarray:
+        """
+            Buffer uint8 [T, Z, 1, Y, X] (empaquetado: [T, Z, 1, Y, ceil(X/8)]) de la máscara
+            del canal, reutilizado si ya tiene la forma.
+        """
+        T, Z, Y, X = forma
+        forma_binaria = (T, Z, 1, Y, (X + 7) // 8 if self.empaquetar else X)
+        if len(self.img_binaria) != C:
+            self.img_binaria = [None] * C
+        binaria = self.img_binaria[canal]
+        if binaria is None or binaria.shape != forma_binaria:
+            binaria = self.img_binaria[canal] = np.empty(forma_binaria, dtype=np.uint8)
+        self.version_binaria += 1
+        return binaria
+
+    def _umbralizar(self, src: np.ndarray, mascara: np.ndarray):
+        """
+            Escribe en mascara (uint8, misma forma que src o empaquetada sobre X) los píxeles
+            de src mayores al umbral. Sin empaquetar, np.greater escribe el resultado booleano
+            directamente en los bytes del buffer final; empaquetado, el temporal booleano es
+            del tamaño de src.
+        """
+        if self.empaquetar:
+            mascara[...] = np.packbits(np.greater(src, self.umbral), axis=-1, bitorder='little')
+        else:
+            np.greater(src, self.umbral, out=mascara.view(np.bool_))
+
+    def _binarizar(self, dst: np.ndarray, canal: int, C: int):
+        """
+            Máscara del canal recién normalizado (todavía caliente en caché), sin temporales
+            del tamaño del canal ni un cast posterior. Empaquetada se procesa fotograma a
+            fotograma para acotar el temporal booleano.
+        """
+        mascara = self._buffer_binario(dst.shape, canal, C)[:, :, 0]
+        if self.empaquetar:
+            for t in range(dst.shape[0]):
+                self._umbralizar(dst[t], mascara[t])
+        else:
+            self._umbralizar(dst, mascara)
+
+    def canal_normalizado(self, canal: int) -> Optional[np.ndarray]:
+        """
+            Retorna la vista (T, Z, Y, X) del canal normalizado, o None si aún no se procesó
+            (o si el normalizador no conserva resultados, keep_cache=False).
+        """
+        if self._norm_valid is None or not (0 <= canal < len(self._norm_valid)) or not self._norm_valid[canal]:
             return None
+        return self.img_normalizada[canal]
 
     def reset(self):
         """Resetea las imágenes normalizadas almacenadas."""
-        self.img_normalizada = None
\ No newline at end of file
+        self.img_normalizada = None
+        self._norm_valid = None
+        self.img_binaria = []
+        self._estadisticos.clear()
+        self._img_ref = None
\ No newline at end of file
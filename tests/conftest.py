@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Los módulos se importan como en la aplicación, con bioImageLab como raíz (nucleo.*)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "bioImageLab"))
@@ -0,0 +1,47 @@
+import numpy as np
+
+from nucleo.gestorLab.flujoProcesamiento import CacheLRU, FlujoProcesamiento
+
+
+class _Falla:
+    """Operación que falla sin excepción, como Normalizador: retorna None."""
+
+    def __init__(self):
+        self.llamadas = 0
+
+    def __call__(self, img):
+        self.llamadas += 1
+        return None
+
+
+class _Doble:
+    def __call__(self, img):
+        return img * 2
+
+
+def test_resultado_none_no_se_cachea():
+    cache = CacheLRU()
+    flujo = FlujoProcesamiento(np.arange(12, dtype=np.float32).reshape(3, 4), cache=cache)
+    op = _Falla()
+
+    assert flujo.ejecutar("falla", op) is None
+    assert flujo.ejecutar("falla", op) is None
+    assert op.llamadas == 2
+    assert len(cache._entradas) == 0 and cache._bytes == 0
+
+
+def test_put_ignora_resultados_que_no_son_ndarray():
+    cache = CacheLRU()
+    cache.put("a", None)
+    cache.put("b", [1, 2, 3])
+    assert cache.get("a") is None and cache.get("b") is None
+    assert cache._bytes == 0
+
+
+def test_resultado_ndarray_se_reutiliza():
+    img = np.ones((4, 4), dtype=np.float32)
+    cache = CacheLRU()
+    primero = FlujoProcesamiento(img, cache=cache).ejecutar("doble", _Doble())
+    segundo = FlujoProcesamiento(img, cache=cache).ejecutar("doble", _Doble())
+    assert segundo is primero
+    assert cache._bytes == primero.nbytes
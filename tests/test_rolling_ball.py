@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("numba")
+
+from nucleo.preprocesador.corrector.iluminacion.rolling_ball import RollingBall
+from nucleo.preprocesador.corrector.iluminacion._rb_numba import rolling_ball_numba
+
+
+def _imagen(dtype=np.float32):
+    # Fondo suave más ruido, con lados que no son múltiplos del factor de reducción
+    rng = np.random.default_rng(0)
+    yy, xx = np.mgrid[:301, :403]
+    fondo = 100 + 50 * np.sin(xx / 60) + 30 * np.cos(yy / 40)
+    return (fondo + rng.random(fondo.shape) * 40).astype(dtype)
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_numba_coincide_con_cv2_reducido(dtype):
+    img = _imagen(dtype)
+    rb = RollingBall(radio=50)
+    assert rb._factor > 1
+
+    esperado = rb._fondo_cv2(img)
+    obtenido = rolling_ball_numba(img, rb._elemento, rb._factor)
+
+    assert obtenido.dtype == esperado.dtype == img.dtype
+    np.testing.assert_allclose(obtenido, esperado, atol=1e-3)
+
+
+def test_nan_no_cambia_el_dtype_ni_el_fondo():
+    img = _imagen()
+    con_nan = img.copy()
+    con_nan[10, 10] = np.nan
+    rb = RollingBall(radio=50)
+
+    sin, con = rb(img), rb(con_nan)
+
+    assert con.dtype == sin.dtype == np.float32
+    assert np.isnan(con[10, 10])
+    validos = ~np.isnan(con_nan)
+    np.testing.assert_allclose(con[validos], sin[validos], atol=1e-3)